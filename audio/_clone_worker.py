@@ -0,0 +1,128 @@
+"""
+Persistent OpenVoice clone worker.
+
+Launched once by VoiceCloner._clone_subprocess (possibly under a different
+Python than the main app) and kept alive for the whole run, so torch,
+MeloTTS and the ToneColorConverter are imported and loaded only once.
+
+Protocol: one JSON request per line on stdin, one JSON reply per line on stdout.
+    request: {"text": ..., "ref_audio": ..., "output": ..., "language": ...,
+              "se_path": <optional speaker-embedding cache file>,
+              "precision": "fp16" | "bf16" | "fp32"}
+    reply:   {"status": "ok"} or {"status": "error", "error": "..."}
+
+Usage:
+    python _clone_worker.py <openvoice_path>
+"""
+
+import contextlib
+import json
+import os
+import sys
+
+LANG_MAP = {
+    "en": "EN_NEWEST",
+    "es": "ES",
+    "fr": "FR",
+    "zh": "ZH",
+    "ja": "JP",
+    "ko": "KR",
+}
+
+
+def main():
+    openvoice_path = sys.argv[1]
+    sys.path.insert(0, openvoice_path)
+
+    # Libraries print progress to stdout — keep it off the reply channel
+    reply = sys.stdout
+    sys.stdout = sys.stderr
+
+    import torch
+    from openvoice import se_extractor
+    from openvoice.api import ToneColorConverter
+    from melo.api import TTS as MeloTTS
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    ckpt = os.path.join(openvoice_path, "checkpoints_v2", "converter")
+    tone_converter = ToneColorConverter(os.path.join(ckpt, "config.json"), device=device)
+    tone_converter.load_ckpt(os.path.join(ckpt, "checkpoint.pth"))
+
+    melo_models = {}
+    target_ses = {}
+    source_ses = {}
+
+    def autocast(precision):
+        if precision == "fp16" and device == "cuda":
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        if precision == "bf16":
+            return torch.autocast(device_type=device, dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+
+    def clone(request):
+        ref_audio = request["ref_audio"]
+        output = request["output"]
+
+        # Speaker embedding: memory, then the on-disk cache, then extraction
+        se_path = request.get("se_path")
+        ref_key = se_path or (ref_audio, os.path.getmtime(ref_audio))
+        if ref_key not in target_ses:
+            if se_path and os.path.exists(se_path):
+                target_ses[ref_key] = torch.load(se_path, map_location=device)
+            else:
+                target_ses[ref_key], _ = se_extractor.get_se(ref_audio, device=device)
+                if se_path:
+                    torch.save(target_ses[ref_key], se_path)
+        target_se = target_ses[ref_key]
+
+        melo_lang = LANG_MAP.get(request.get("language", "en"), "EN_NEWEST")
+        if melo_lang not in melo_models:
+            melo_models[melo_lang] = MeloTTS(language=melo_lang, device=device)
+        melo = melo_models[melo_lang]
+
+        speaker_ids = melo.hps.data.spk2id
+        speaker_key = list(speaker_ids.keys())[0]
+        speaker_id = speaker_ids[speaker_key]
+
+        base_path = output.replace(".wav", "_base.wav")
+        precision = request.get("precision", "fp32")
+        with autocast(precision):
+            melo.tts_to_file(request["text"], speaker_id, base_path, speed=1.0)
+
+        try:
+            source_se = source_ses.get(speaker_key)
+            if source_se is None:
+                ses_path = os.path.join(
+                    openvoice_path, "checkpoints_v2", "base_speakers", "ses",
+                    f"{speaker_key.lower().replace('_', '-')}.pth",
+                )
+                if os.path.exists(ses_path):
+                    source_se = source_ses[speaker_key] = torch.load(ses_path, map_location=device)
+                else:
+                    source_se, _ = se_extractor.get_se(base_path, device=device)
+            with autocast(precision):
+                tone_converter.convert(
+                    audio_src_path=base_path,
+                    src_se=source_se,
+                    tgt_se=target_se,
+                    output_path=output,
+                )
+        finally:
+            if os.path.exists(base_path):
+                os.remove(base_path)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            clone(json.loads(line))
+            response = {"status": "ok"}
+        except Exception as e:
+            response = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        reply.write(json.dumps(response) + "\n")
+        reply.flush()
+
+
+if __name__ == "__main__":
+    main()
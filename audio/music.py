@@ -13,6 +13,9 @@ MUSIC_DIR = os.path.join(BASE_DIR, "assets", "music")
 class MusicManager:
     """Manages background music selection and loading."""
 
+    _EXTS = (".mp3", ".wav", ".ogg")
+    MOODS = ("calm", "upbeat", "dramatic", "inspiring", "funny")
+
     def __init__(self, config=None):
         self.config = config or {}
         music_config = self.config.get("music", {})
@@ -21,6 +24,43 @@ class MusicManager:
         self.fade_in = music_config.get("fade_in", 1.0)
         self.fade_out = music_config.get("fade_out", 2.0)
 
+        # Directory listing cache, invalidated when MUSIC_DIR mtime changes
+        self._cache = None
+        self._cache_mtime = 0
+        self._mood_index = {}
+
+    def _iter_music(self):
+        """
+        Return the names of all music files in MUSIC_DIR.
+
+        The listing is cached and only rescanned when the directory mtime changes.
+        """
+        try:
+            mtime = os.stat(MUSIC_DIR).st_mtime_ns
+        except FileNotFoundError:
+            os.makedirs(MUSIC_DIR, exist_ok=True)
+            mtime = os.stat(MUSIC_DIR).st_mtime_ns
+
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+
+        with os.scandir(MUSIC_DIR) as it:
+            self._cache = sorted(
+                e.name for e in it
+                if e.is_file(follow_symlinks=False) and e.name.endswith(self._EXTS)
+            )
+        self._cache_mtime = mtime
+
+        # Index known moods once per rescan so lookups are a dict hit
+        self._mood_index = {mood: [] for mood in self.MOODS}
+        for name in self._cache:
+            lname = name.lower()
+            for mood in self.MOODS:
+                if mood in lname:
+                    self._mood_index[mood].append(name)
+
+        return self._cache
+
     def get_music_file(self, mood=None):
         """
         Get a music file path matching the mood.
@@ -35,19 +75,17 @@ class MusicManager:
         if not self.enabled:
             return None
 
-        os.makedirs(MUSIC_DIR, exist_ok=True)
-
-        music_files = [
-            f for f in os.listdir(MUSIC_DIR)
-            if f.endswith((".mp3", ".wav", ".ogg"))
-        ]
+        music_files = self._iter_music()
 
         if not music_files:
             return None
 
         # Try mood-based matching
         if mood:
-            mood_matches = [f for f in music_files if mood.lower() in f.lower()]
+            mood = mood.lower()
+            mood_matches = self._mood_index.get(mood)
+            if mood_matches is None:
+                mood_matches = [f for f in music_files if mood in f.lower()]
             if mood_matches:
                 return os.path.join(MUSIC_DIR, random.choice(mood_matches))
 
@@ -55,8 +93,4 @@ class MusicManager:
 
     def list_available(self):
         """List all available music files."""
-        os.makedirs(MUSIC_DIR, exist_ok=True)
-        return [
-            f for f in os.listdir(MUSIC_DIR)
-            if f.endswith((".mp3", ".wav", ".ogg"))
-        ]
+        return list(self._iter_music())
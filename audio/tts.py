@@ -10,11 +10,18 @@ import hashlib
 import json
 import os
 import sys
+import threading
+import time
+from collections import defaultdict
 
 import edge_tts
 
+from utils.cache import ensure_dir
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_DIR = os.path.join(BASE_DIR, "cache", "tts")
+VOICES_CACHE_PATH = os.path.join(CACHE_DIR, "voices.json")
+VOICES_CACHE_TTL = 7 * 24 * 3600  # Refresh the Edge voice list weekly
 
 # Language code normalization map
 LANG_NORMALIZE = {
@@ -32,6 +39,87 @@ LANG_NORMALIZE = {
 # Preferred voice cache (populated on first discovery)
 _voice_cache = {}
 
+# Full Edge TTS voice list (fetched once per process, persisted to disk)
+_ALL_VOICES = None
+# Locale prefix ("de", "de-de", ...) -> matching voice dicts, built from _ALL_VOICES
+_VOICES_BY_PREFIX = None
+
+# Shared background event loop (created lazily, lives for the process)
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    """Return the shared event loop, starting it in a daemon thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            if sys.platform == "win32":
+                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="tts-loop", daemon=True
+            ).start()
+    return _loop
+
+
+def _run_async(coro):
+    """Run a coroutine on the shared loop and block until it completes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def _get_all_voices():
+    """
+    Get the full Edge TTS voice list.
+
+    Served from memory, then from the on-disk cache if younger than
+    VOICES_CACHE_TTL, and only fetched from the network as a last resort.
+    """
+    global _ALL_VOICES
+    if _ALL_VOICES is not None:
+        return _ALL_VOICES
+
+    try:
+        if time.time() - os.path.getmtime(VOICES_CACHE_PATH) < VOICES_CACHE_TTL:
+            with open(VOICES_CACHE_PATH, "r", encoding="utf-8") as f:
+                _ALL_VOICES = json.load(f)
+            return _ALL_VOICES
+    except (OSError, ValueError):
+        pass
+
+    voices = await edge_tts.list_voices()
+
+    try:
+        ensure_dir(CACHE_DIR)
+        with open(VOICES_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(voices, f)
+    except OSError:
+        pass
+
+    _ALL_VOICES = voices
+    return voices
+
+
+def _voice_entry(v):
+    """Convert a raw Edge TTS voice record to our voice dict."""
+    return {
+        "name": v["ShortName"],
+        "gender": v["Gender"],
+        "locale": v.get("Locale", ""),
+        "friendly_name": v.get("FriendlyName", v["ShortName"]),
+    }
+
+
+def _build_prefix_index(all_voices):
+    """Index voices under every hyphen-separated prefix of their locale."""
+    index = defaultdict(list)
+    for v in all_voices:
+        entry = _voice_entry(v)
+        parts = entry["locale"].lower().split("-")
+        for i in range(1, len(parts) + 1):
+            index["-".join(parts[:i])].append(entry)
+    return dict(index)
+
 
 class TTSEngine:
     """
@@ -44,6 +132,8 @@ class TTSEngine:
     - Full backward compatibility with existing voiceover module
     """
 
+    _GENDER_MAP = {"male": "Male", "female": "Female"}
+
     def __init__(self, config=None):
         self.config = config or {}
         vo_config = self.config.get("voiceover", {})
@@ -84,35 +174,59 @@ class TTSEngine:
         if normalized in _voice_cache:
             return _voice_cache[normalized]
 
-        if sys.platform == "win32":
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-        loop = asyncio.new_event_loop()
-        try:
-            voices = loop.run_until_complete(self._discover_async(normalized))
-        finally:
-            loop.close()
+        voices = _run_async(self._discover_async(normalized))
 
         _voice_cache[normalized] = voices
         return voices
 
+    def discover_voices_many(self, language_codes):
+        """
+        Discover voices for several languages at once.
+
+        The full voice list is fetched at most once and filtered locally,
+        so this costs a single round-trip to the event loop.
+
+        Args:
+            language_codes: Iterable of language codes
+
+        Returns:
+            Dict mapping each given code to its list of voice dicts
+        """
+        language_codes = list(language_codes)
+        if all(self.normalize_language(c) in _voice_cache for c in language_codes):
+            return {c: _voice_cache[self.normalize_language(c)] for c in language_codes}
+
+        return _run_async(self._discover_many_async(language_codes))
+
+    async def _discover_many_async(self, language_codes):
+        """Async multi-language voice discovery."""
+        results = {}
+        for code in language_codes:
+            normalized = self.normalize_language(code)
+            if normalized not in _voice_cache:
+                _voice_cache[normalized] = await self._discover_async(normalized)
+            results[code] = _voice_cache[normalized]
+        return results
+
     async def _discover_async(self, lang_prefix):
         """Async voice discovery."""
-        all_voices = await edge_tts.list_voices()
-
-        matched = []
-        for v in all_voices:
-            locale = v.get("Locale", "")
-            # Match by prefix (e.g., "de" matches "de-DE", "de-AT", etc.)
-            if locale.lower().startswith(lang_prefix.lower()):
-                matched.append({
-                    "name": v["ShortName"],
-                    "gender": v["Gender"],
-                    "locale": locale,
-                    "friendly_name": v.get("FriendlyName", v["ShortName"]),
-                })
-
-        return matched
+        global _VOICES_BY_PREFIX
+        all_voices = await _get_all_voices()
+
+        if _VOICES_BY_PREFIX is None:
+            _VOICES_BY_PREFIX = _build_prefix_index(all_voices)
+
+        # Match by prefix (e.g., "de" matches "de-DE", "de-AT", etc.)
+        lang_prefix = lang_prefix.lower()
+        matched = _VOICES_BY_PREFIX.get(lang_prefix)
+        if matched is not None:
+            return list(matched)
+
+        # Partial prefixes that don't end on a hyphen boundary
+        return [
+            _voice_entry(v) for v in all_voices
+            if v.get("Locale", "").lower().startswith(lang_prefix)
+        ]
 
     def get_best_voice(self, language, gender="male"):
         """
@@ -148,8 +262,7 @@ class TTSEngine:
             return "en-US-GuyNeural"
 
         # Prefer matching gender
-        gender_map = {"male": "Male", "female": "Female"}
-        target_gender = gender_map.get(gender, "Male")
+        target_gender = self._GENDER_MAP.get(gender, "Male")
 
         matching = [v for v in voices if v["gender"] == target_gender]
         if matching:
@@ -185,8 +298,7 @@ class TTSEngine:
             return "en-US-GuyNeural"
 
         # Split by gender
-        gender_map = {"male": "Male", "female": "Female"}
-        target_gender = gender_map.get(gender, "Male")
+        target_gender = self._GENDER_MAP.get(gender, "Male")
         matching = [v for v in voices if v["gender"] == target_gender]
 
         if not matching:
@@ -210,6 +322,53 @@ class TTSEngine:
         Returns:
             dict with audio_path, duration, word_timestamps
         """
+        # Use existing voiceover module for actual generation
+        from modules.voiceover import generate_voiceover
+
+        return generate_voiceover(**self._resolve_request(
+            text, voice, output_path, rate, pitch
+        ))
+
+    def generate_batch(self, items, max_concurrency=8):
+        """
+        Generate TTS audio for several texts concurrently.
+
+        All requests share one event loop and run with asyncio.gather, so the
+        wall-clock cost is close to the slowest request rather than the sum.
+
+        Args:
+            items: List of dicts with "text" and optional "voice",
+                   "output_path", "rate", "pitch" (same meaning as generate())
+            max_concurrency: Maximum simultaneous Edge TTS connections
+
+        Returns:
+            List of result dicts (same order as items)
+        """
+        if not items:
+            return []
+        return _run_async(self._generate_async_batch(items, max_concurrency))
+
+    async def _generate_async_batch(self, items, max_concurrency):
+        """Async batch generation."""
+        from modules.voiceover import generate_voiceover_async
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(item):
+            request = self._resolve_request(
+                item["text"],
+                item.get("voice"),
+                item.get("output_path"),
+                item.get("rate"),
+                item.get("pitch"),
+            )
+            async with semaphore:
+                return await generate_voiceover_async(**request)
+
+        return await asyncio.gather(*(_one(item) for item in items))
+
+    def _resolve_request(self, text, voice, output_path, rate, pitch):
+        """Fill in defaults and the cache path for a single TTS request."""
         if voice is None:
             voice = "en-US-GuyNeural"
         if rate is None:
@@ -217,22 +376,19 @@ class TTSEngine:
         if pitch is None:
             pitch = self.pitch
 
-        # Use existing voiceover module for actual generation
-        from modules.voiceover import generate_voiceover
-
         if output_path is None:
-            os.makedirs(CACHE_DIR, exist_ok=True)
+            ensure_dir(CACHE_DIR)
             key = f"{text}|{voice}|{rate}|{pitch}"
-            h = hashlib.md5(key.encode("utf-8")).hexdigest()[:16]
+            h = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
             output_path = os.path.join(CACHE_DIR, f"{h}.mp3")
 
-        return generate_voiceover(
-            text=text,
-            output_path=output_path,
-            voice=voice,
-            rate=rate,
-            pitch=pitch,
-        )
+        return {
+            "text": text,
+            "output_path": output_path,
+            "voice": voice,
+            "rate": rate,
+            "pitch": pitch,
+        }
 
     def list_voices_formatted(self, language):
         """
@@ -12,16 +12,56 @@ Requirements:
 May run as subprocess if Python version mismatch (OpenVoice needs 3.9-3.10).
 """
 
+import contextlib
 import hashlib
+import importlib.util
 import json
 import os
+import queue
 import subprocess
 import sys
-import tempfile
+import threading
+import wave
+
+import numpy as np
 
 from utils.cache import ensure_cache_dir, is_cached
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_clone_worker.py")
+WORKER_TIMEOUT = 120  # seconds per clone request
+VECTORIZE_MIN_WORDS = 500  # use NumPy for timestamp math above this many words
+
+# Language code -> MeloTTS language
+MELO_LANG_MAP = {
+    "en": "EN_NEWEST",
+    "es": "ES",
+    "fr": "FR",
+    "zh": "ZH",
+    "ja": "JP",
+    "ko": "KR",
+}
+
+# Language code -> Edge TTS voice used when cloning is unavailable
+FALLBACK_VOICE_MAP = {
+    "en": "en-US-GuyNeural",
+    "sk": "sk-SK-LukasNeural",
+    "cs": "cs-CZ-AntoninNeural",
+    "cz": "cs-CZ-AntoninNeural",
+    "de": "de-DE-ConradNeural",
+    "fr": "fr-FR-HenriNeural",
+    "es": "es-ES-AlvaroNeural",
+    "ja": "ja-JP-KeitaNeural",
+    "ko": "ko-KR-InJoonNeural",
+    "zh": "zh-CN-YunxiNeural",
+}
+
+
+def _pump_lines(stream, out_queue):
+    """Forward lines from a worker pipe to a queue; None marks EOF."""
+    for line in stream:
+        out_queue.put(line)
+    out_queue.put(None)
 
 
 class VoiceCloner:
@@ -34,13 +74,26 @@ class VoiceCloner:
         # result = {"audio_path": ..., "duration": ..., "word_timestamps": [...]}
     """
 
+    # Shared across instances: whether openvoice is importable in this process
+    _openvoice_importable = None
+
     def __init__(self, config=None):
         self.config = config or {}
         self.engine = self.config.get("engine", "openvoice")
         self.reference_audio = self.config.get("reference_audio", "")
         self.openvoice_path = self.config.get("openvoice_path", "")
+        self.precision = self.config.get("precision", "fp16")  # fp16, bf16 or fp32
         self.cache_dir = ensure_cache_dir("voice_clone")
         self._available = None
+        self._worker = None
+        self._worker_replies = None
+
+        # In-process model cache (loaded on first clone, reused afterwards)
+        self._melo_cache = {}
+        self._tone_converter = None
+        self._target_se = None
+        self._target_se_key = None
+        self._source_se_cache = {}
 
     def is_available(self):
         """Check if voice cloning is available."""
@@ -51,17 +104,19 @@ class VoiceCloner:
             self._available = False
             return False
 
-        # Try importing OpenVoice
-        try:
-            from openvoice import se_extractor
-            from openvoice.api import ToneColorConverter
+        # Probe for OpenVoice once per process; find_spec doesn't run module init
+        if VoiceCloner._openvoice_importable is None:
+            VoiceCloner._openvoice_importable = (
+                importlib.util.find_spec("openvoice") is not None
+            )
+
+        if VoiceCloner._openvoice_importable:
             self._available = True
-        except ImportError:
-            # Check if available via subprocess
-            if self.openvoice_path and os.path.exists(self.openvoice_path):
-                self._available = True
-            else:
-                self._available = False
+        # Check if available via subprocess
+        elif self.openvoice_path and os.path.exists(self.openvoice_path):
+            self._available = True
+        else:
+            self._available = False
 
         return self._available
 
@@ -84,9 +139,9 @@ class VoiceCloner:
             dict with audio_path, duration, word_timestamps
         """
         # Check cache
-        cache_key = hashlib.md5(
-            f"{text}|{self.reference_audio}|{language}".encode()
-        ).hexdigest()[:16]
+        cache_key = hashlib.blake2b(
+            f"{text}|{self.reference_audio}|{language}".encode(), digest_size=8
+        ).hexdigest()
         cached_path = os.path.join(self.cache_dir, f"clone_{cache_key}.wav")
         meta_path = cached_path.replace(".wav", "_meta.json")
 
@@ -129,25 +184,29 @@ class VoiceCloner:
 
         device = "cuda" if torch.cuda.is_available() else "cpu"
 
-        # Extract speaker embedding from reference
-        print("   [VoiceClone] Extracting voice color from reference...")
-        target_se, _ = se_extractor.get_se(
-            self.reference_audio, device=device
-        )
+        # Extract speaker embedding from reference (reused until the file changes)
+        se_path = self._target_se_path()
+        se_key = (se_path, device)
+        if self._target_se_key != se_key:
+            if is_cached(se_path):
+                self._target_se = torch.load(se_path, map_location=device)
+            else:
+                print("   [VoiceClone] Extracting voice color from reference...")
+                self._target_se, _ = se_extractor.get_se(
+                    self.reference_audio, device=device
+                )
+                torch.save(self._target_se, se_path)
+            self._target_se_key = se_key
+        target_se = self._target_se
 
         # Generate base speech with MeloTTS
-        lang_map = {
-            "en": "EN_NEWEST",
-            "es": "ES",
-            "fr": "FR",
-            "zh": "ZH",
-            "ja": "JP",
-            "ko": "KR",
-        }
-        melo_lang = lang_map.get(language, "EN_NEWEST")
+        melo_lang = MELO_LANG_MAP.get(language, "EN_NEWEST")
 
         print(f"   [VoiceClone] Generating base speech ({melo_lang})...")
-        melo = MeloTTS(language=melo_lang, device=device)
+        melo = self._melo_cache.get((melo_lang, device))
+        if melo is None:
+            melo = MeloTTS(language=melo_lang, device=device)
+            self._melo_cache[(melo_lang, device)] = melo
         speaker_ids = melo.hps.data.spk2id
 
         # Get first available speaker
@@ -156,30 +215,45 @@ class VoiceCloner:
 
         # Generate base audio to temp file
         base_path = output_path.replace(".wav", "_base.wav")
-        melo.tts_to_file(text, speaker_id, base_path, speed=1.0)
+        with self._autocast(torch, device):
+            melo.tts_to_file(text, speaker_id, base_path, speed=1.0)
 
         # Apply voice color transfer
         print("   [VoiceClone] Applying voice color transfer...")
-        ckpt_path = os.path.join(
-            self.openvoice_path or ".",
-            "checkpoints_v2", "converter"
-        )
-
-        tone_converter = ToneColorConverter(
-            os.path.join(ckpt_path, "config.json"), device=device
-        )
-        tone_converter.load_ckpt(os.path.join(ckpt_path, "checkpoint.pth"))
+        if self._tone_converter is None:
+            ckpt_path = os.path.join(
+                self.openvoice_path or ".",
+                "checkpoints_v2", "converter"
+            )
 
-        # Extract source speaker embedding
-        source_se, _ = se_extractor.get_se(base_path, device=device)
+            self._tone_converter = ToneColorConverter(
+                os.path.join(ckpt_path, "config.json"), device=device
+            )
+            self._tone_converter.load_ckpt(os.path.join(ckpt_path, "checkpoint.pth"))
+        tone_converter = self._tone_converter
+
+        # Source speaker embedding: OpenVoice ships one per MeloTTS base speaker,
+        # so the base audio only needs re-reading when that file is missing
+        source_se = self._source_se_cache.get((speaker_key, device))
+        if source_se is None:
+            ses_path = os.path.join(
+                self.openvoice_path or ".", "checkpoints_v2", "base_speakers", "ses",
+                f"{speaker_key.lower().replace('_', '-')}.pth",
+            )
+            if os.path.exists(ses_path):
+                source_se = torch.load(ses_path, map_location=device)
+                self._source_se_cache[(speaker_key, device)] = source_se
+            else:
+                source_se, _ = se_extractor.get_se(base_path, device=device)
 
         # Convert
-        tone_converter.convert(
-            audio_src_path=base_path,
-            src_se=source_se,
-            tgt_se=target_se,
-            output_path=output_path,
-        )
+        with self._autocast(torch, device):
+            tone_converter.convert(
+                audio_src_path=base_path,
+                src_se=source_se,
+                tgt_se=target_se,
+                output_path=output_path,
+            )
 
         # Get duration and create approximate timestamps
         duration = self._get_duration(output_path)
@@ -198,104 +272,124 @@ class VoiceCloner:
         }
 
     def _clone_subprocess(self, text, language, output_path):
-        """Run voice cloning as subprocess (for Python version isolation)."""
+        """Run voice cloning in the persistent worker subprocess (for Python version isolation)."""
         if not self.openvoice_path:
             raise RuntimeError("openvoice_path not configured")
 
-        # Write clone script
-        script = f'''
-import sys
-sys.path.insert(0, "{self.openvoice_path}")
-import torch
-from openvoice import se_extractor
-from openvoice.api import ToneColorConverter
-from melo.api import TTS as MeloTTS
-import json
-
-device = "cuda" if torch.cuda.is_available() else "cpu"
-text = """{text.replace('"', '\\"')}"""
-ref_audio = "{self.reference_audio}"
-output = "{output_path}"
-language = "{language}"
-
-target_se, _ = se_extractor.get_se(ref_audio, device=device)
-
-lang_map = {{"en": "EN_NEWEST", "es": "ES", "fr": "FR", "zh": "ZH", "ja": "JP", "ko": "KR"}}
-melo_lang = lang_map.get(language, "EN_NEWEST")
-
-melo = MeloTTS(language=melo_lang, device=device)
-speaker_ids = melo.hps.data.spk2id
-speaker_key = list(speaker_ids.keys())[0]
-speaker_id = speaker_ids[speaker_key]
+        worker = self._get_worker()
+        request = {
+            "text": text,
+            "ref_audio": self.reference_audio,
+            "output": output_path,
+            "language": language,
+            "se_path": self._target_se_path(),
+            "precision": self.precision,
+        }
 
-base_path = output.replace(".wav", "_base.wav")
-melo.tts_to_file(text, speaker_id, base_path, speed=1.0)
+        try:
+            worker.stdin.write(json.dumps(request) + "\n")
+            worker.stdin.flush()
+            line = self._worker_replies.get(timeout=WORKER_TIMEOUT)
+        except (OSError, queue.Empty):
+            self.close()
+            raise RuntimeError("Clone worker did not respond")
 
-ckpt = "{os.path.join(self.openvoice_path, 'checkpoints_v2', 'converter')}"
-tc = ToneColorConverter(ckpt + "/config.json", device=device)
-tc.load_ckpt(ckpt + "/checkpoint.pth")
+        if line is None:
+            self.close()
+            raise RuntimeError("Clone worker exited unexpectedly")
 
-source_se, _ = se_extractor.get_se(base_path, device=device)
-tc.convert(audio_src_path=base_path, src_se=source_se, tgt_se=target_se, output_path=output)
+        reply = json.loads(line)
+        if reply.get("status") != "ok":
+            raise RuntimeError(f"Clone subprocess failed: {reply.get('error', '')[-200:]}")
 
-import os
-if os.path.exists(base_path):
-    os.remove(base_path)
+        duration = self._get_duration(output_path)
+        timestamps = self._approximate_timestamps(text, duration)
 
-print("SUCCESS")
-'''
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(script)
-            script_path = f.name
+        return {
+            "audio_path": output_path,
+            "duration": duration,
+            "word_timestamps": timestamps,
+        }
 
+    def _autocast(self, torch, device):
+        """Reduced-precision inference context for the configured precision."""
+        if self.precision == "fp16" and device == "cuda":
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        if self.precision == "bf16":
+            return torch.autocast(device_type=device, dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+
+    def _target_se_path(self):
+        """Disk cache path for the reference speaker embedding, keyed by file mtime."""
+        mtime = os.stat(self.reference_audio).st_mtime_ns
+        key = hashlib.blake2b(
+            f"{os.path.abspath(self.reference_audio)}|{mtime}".encode(), digest_size=8
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"se_{key}.pt")
+
+    def _get_worker(self):
+        """Start the clone worker on first use and return it."""
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+
+        self._worker = subprocess.Popen(
+            [sys.executable, WORKER_PATH, self.openvoice_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._worker_replies = queue.Queue()
+        threading.Thread(
+            target=_pump_lines,
+            args=(self._worker.stdout, self._worker_replies),
+            daemon=True,
+        ).start()
+        return self._worker
+
+    def close(self):
+        """Shut down the clone worker subprocess, if running."""
+        if self._worker is None:
+            return
         try:
-            result = subprocess.run(
-                [sys.executable, script_path],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-
-            if result.returncode != 0 or "SUCCESS" not in result.stdout:
-                raise RuntimeError(f"Clone subprocess failed: {result.stderr[-200:]}")
-
-            duration = self._get_duration(output_path)
-            timestamps = self._approximate_timestamps(text, duration)
-
-            return {
-                "audio_path": output_path,
-                "duration": duration,
-                "word_timestamps": timestamps,
-            }
-        finally:
-            os.unlink(script_path)
+            self._worker.stdin.close()
+            self._worker.wait(timeout=5)
+        except Exception:
+            self._worker.kill()
+        self._worker = None
 
     def _fallback_tts(self, text, language):
         """Fall back to Edge TTS when voice cloning is unavailable."""
         from modules.voiceover import generate_voiceover
 
         # Map language to voice
-        voice_map = {
-            "en": "en-US-GuyNeural",
-            "sk": "sk-SK-LukasNeural",
-            "cs": "cs-CZ-AntoninNeural",
-            "cz": "cs-CZ-AntoninNeural",
-            "de": "de-DE-ConradNeural",
-            "fr": "fr-FR-HenriNeural",
-            "es": "es-ES-AlvaroNeural",
-            "ja": "ja-JP-KeitaNeural",
-            "ko": "ko-KR-InJoonNeural",
-            "zh": "zh-CN-YunxiNeural",
-        }
-        voice = voice_map.get(language, "en-US-GuyNeural")
+        voice = FALLBACK_VOICE_MAP.get(language, "en-US-GuyNeural")
 
-        cache_key = hashlib.md5(f"vc_fb_{text}_{voice}".encode()).hexdigest()[:12]
+        cache_key = hashlib.blake2b(
+            f"vc_fb_{text}_{voice}".encode(), digest_size=6
+        ).hexdigest()
         output_path = os.path.join(self.cache_dir, f"fb_{cache_key}.mp3")
 
         return generate_voiceover(text=text, output_path=output_path, voice=voice)
 
     def _get_duration(self, audio_path):
-        """Get audio duration."""
+        """Get audio duration, reading only the file header when possible."""
+        # WAV: frame count and rate come straight from the RIFF header
+        try:
+            with wave.open(audio_path, "rb") as wf:
+                return round(wf.getnframes() / wf.getframerate(), 2)
+        except (wave.Error, EOFError, OSError, ZeroDivisionError):
+            pass
+
+        # Other formats: mutagen parses headers without decoding (optional)
+        try:
+            from mutagen import File as MutagenFile
+            return round(MutagenFile(audio_path).info.length, 2)
+        except Exception:
+            pass
+
         try:
             from moviepy import AudioFileClip
             clip = AudioFileClip(audio_path)
@@ -312,16 +406,25 @@ print("SUCCESS")
         if not words:
             return []
 
-        char_lengths = [len(w) + 1 for w in words]
-        total_chars = sum(char_lengths)
+        if len(words) >= VECTORIZE_MIN_WORDS:
+            # Long transcripts: compute all boundaries with one cumsum
+            lens = np.fromiter((len(w) + 1 for w in words), dtype=np.float64, count=len(words))
+            ends = np.cumsum(lens) * (duration / lens.sum())
+            starts = np.concatenate(([0.0], ends[:-1]))
+            return [
+                {"word": w, "start": s, "end": e}
+                for w, s, e in zip(words, np.round(starts, 3).tolist(), np.round(ends, 3).tolist())
+            ]
+
+        # Seconds per character (+1 per word for the trailing space/pause)
+        sec_per_char = duration / sum(len(w) + 1 for w in words)
         current_time = 0.0
         timestamps = []
+        append = timestamps.append
 
-        for i, word in enumerate(words):
-            fraction = char_lengths[i] / total_chars
-            word_dur = duration * fraction
-
-            timestamps.append({
+        for word in words:
+            word_dur = (len(word) + 1) * sec_per_char
+            append({
                 "word": word,
                 "start": round(current_time, 3),
                 "end": round(current_time + word_dur, 3),
@@ -6,6 +6,8 @@ Usage:
   python batch_generate.py --topics topics.txt
   python batch_generate.py --topics topics.txt --count 5 --lang sk
   python batch_generate.py --category education --count 3
+  python batch_generate.py --category education --count 10 --jobs 4
+  python batch_generate.py --topics topics.txt --isolate   # fresh process per video
 
 NEW: Auto mode batch:
   python batch_generate.py --category education --mode auto --brain template
@@ -13,19 +15,40 @@ NEW: Auto mode batch:
 """
 
 import argparse
+import contextlib
+import itertools
 import os
+import signal
+import subprocess
 import sys
+import tempfile
+import threading
 import time
+import uuid
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from types import MappingProxyType
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
 from modules.script_generator import generate_script
 
-# Default topics by category for auto-generation
-DEFAULT_TOPICS = {
-    "education": [
+# Lines of child stderr kept for error reports in --isolate mode
+STDERR_TAIL_LINES = 64
+
+# Per-video time limit in seconds (both modes)
+VIDEO_TIMEOUT = 300
+
+# Pooled workers enforce the limit with SIGALRM; without it (Windows)
+# every video runs isolated instead
+POOL_SUPPORTED = hasattr(signal, "SIGALRM")
+
+# Default topics by category for auto-generation (read-only, shared by workers)
+DEFAULT_TOPICS = MappingProxyType({
+    "education": (
         "Benefits of reading every day",
         "How sleep affects your brain",
         "3 habits of successful people",
@@ -36,8 +59,8 @@ DEFAULT_TOPICS = {
         "The power of compound interest",
         "How your diet affects your mood",
         "Why journaling changes your life",
-    ],
-    "lifestyle": [
+    ),
+    "lifestyle": (
         "Morning routine for productivity",
         "5 minute stress relief techniques",
         "How to build better habits",
@@ -48,8 +71,8 @@ DEFAULT_TOPICS = {
         "Healthy meal prep basics",
         "Time management secrets",
         "How to stay motivated daily",
-    ],
-    "wellness": [
+    ),
+    "wellness": (
         "Benefits of CBD for anxiety",
         "Natural ways to improve sleep",
         "Understanding adaptogens",
@@ -60,15 +83,15 @@ DEFAULT_TOPICS = {
         "Mindfulness for beginners",
         "Benefits of herbal supplements",
         "How to reduce inflammation naturally",
-    ],
-    "product": [
+    ),
+    "product": (
         "Best wellness products of 2025",
         "CBD oil buying guide",
         "Top supplements you actually need",
         "Wellness gadgets worth the money",
         "Natural skincare essentials",
-    ],
-}
+    ),
+})
 
 
 def load_topics_from_file(filepath):
@@ -82,6 +105,186 @@ def load_topics_from_file(filepath):
     return topics
 
 
+def _generate_argv(topic, args):
+    """Build the generate.py arguments for one topic."""
+    cmd_args = [
+        "--topic", topic,
+        "--mode", args.mode,
+        "--lang", args.lang,
+        "--duration", str(args.duration),
+        "--style", args.style,
+    ]
+    if args.no_music:
+        cmd_args.append("--no-music")
+    if args.no_subtitles:
+        cmd_args.append("--no-subtitles")
+
+    # NEW: Auto mode args
+    if args.mode == "auto":
+        cmd_args.extend(["--brain", args.brain])
+        cmd_args.extend(["--visuals", args.visuals])
+        if args.voice_clone:
+            cmd_args.append("--voice-clone")
+        if args.no_brain_cache:
+            cmd_args.append("--no-brain-cache")
+
+    return cmd_args
+
+
+def _warm_imports():
+    """Pool initializer: import the heavy pipeline modules once per worker."""
+    __import__("generate")  # required: let a broken install fail here
+    for name in ("modules.script_generator", "modules.voiceover", "modules.visuals",
+                 "modules.composer", "modules.subtitles",
+                 "brain.director", "composer.timeline", "anthropic"):
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+
+class _VideoTimeout(BaseException):
+    """
+    Raised in a pool worker when a video exceeds VIDEO_TIMEOUT.
+
+    A BaseException, so the pipeline's broad `except Exception` fallbacks
+    can't swallow it.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise _VideoTimeout()
+
+
+def _run_one_pooled(topic, args):
+    """
+    Generate a single video inside a warm pool worker.
+
+    Returns:
+        Result dict with topic, status, time and output or error
+    """
+    import generate
+
+    video_start = time.perf_counter()
+
+    # Same limit as --isolate: SIGALRM interrupts the worker's main thread
+    signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.alarm(VIDEO_TIMEOUT)
+    try:
+        gen_args = generate.build_parser().parse_args(_generate_argv(topic, args))
+        # Keep per-video progress output off the shared console
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            output_path = generate.run(gen_args)
+
+        return {
+            "topic": topic,
+            "status": "success",
+            "time": time.perf_counter() - video_start,
+            "output": output_path,
+        }
+    except _VideoTimeout:
+        return {
+            "topic": topic,
+            "status": "timeout",
+            "time": VIDEO_TIMEOUT,
+        }
+    except (Exception, SystemExit) as e:
+        return {
+            "topic": topic,
+            "status": "error",
+            "time": time.perf_counter() - video_start,
+            "error": f"{type(e).__name__}: {e}"[-200:],
+        }
+    finally:
+        signal.alarm(0)
+
+
+def _run_one(topic, args):
+    """
+    Generate a single video in a fresh subprocess (isolates memory).
+
+    Returns:
+        Result dict with topic, status, time and output or error
+    """
+    video_start = time.perf_counter()
+    result_path = os.path.join(tempfile.gettempdir(), f"vr_{uuid.uuid4().hex}.json")
+
+    try:
+        # The child reports its output path via --result-json, so its
+        # (very chatty) stdout never needs to be captured or parsed
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(PROJECT_ROOT, "generate.py")]
+            + _generate_argv(topic, args)
+            + ["--result-json", result_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=PROJECT_ROOT,
+        )
+        # Only the end of stderr is ever reported: keep a bounded tail
+        # instead of buffering everything ffmpeg/moviepy print
+        stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        reader = threading.Thread(
+            target=stderr_tail.extend, args=(proc.stderr,), daemon=True
+        )
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=VIDEO_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join()
+            proc.stderr.close()
+
+        video_time = time.perf_counter() - video_start
+
+        if returncode == 0:
+            output = ""
+            try:
+                with open(result_path, "r", encoding="utf-8") as f:
+                    output = json.load(f).get("output", "")
+            except (OSError, ValueError):
+                pass
+
+            return {
+                "topic": topic,
+                "status": "success",
+                "time": video_time,
+                "output": output,
+            }
+
+        return {
+            "topic": topic,
+            "status": "error",
+            "time": video_time,
+            "error": "".join(stderr_tail)[-200:] or "Unknown error",
+        }
+
+    except subprocess.TimeoutExpired:
+        return {
+            "topic": topic,
+            "status": "timeout",
+            "time": VIDEO_TIMEOUT,
+        }
+    except Exception as e:
+        return {
+            "topic": topic,
+            "status": "error",
+            "error": str(e),
+        }
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(result_path)
+
+
+def _rounded_times(result):
+    """Copy of a result dict with float timings rounded for the JSON report."""
+    return {k: round(v, 1) if isinstance(v, float) else v
+            for k, v in result.items()}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ULTIMATE AI VIDEO CREATOR — Batch generate videos"
@@ -117,6 +320,14 @@ def main():
                         help="Visual mode for auto mode (default: stock)")
     parser.add_argument("--voice-clone", action="store_true",
                         help="Enable voice cloning")
+    parser.add_argument("--no-brain-cache", action="store_true",
+                        help="Always call the Claude API instead of reusing cached storyboards")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Videos to generate in parallel "
+                             "(default: one per 4 CPU cores; always 1 for GPU visuals)")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run each video in a fresh Python process "
+                             "(slower start-up; a crash can't affect other videos)")
 
     args = parser.parse_args()
 
@@ -129,7 +340,19 @@ def main():
         topics = DEFAULT_TOPICS["education"]
 
     # Limit to requested count
-    topics = topics[:args.count]
+    topics = list(itertools.islice(topics, args.count))
+
+    # GPU-heavy runs go one at a time to avoid VRAM thrash
+    gpu_heavy = args.mode == "auto" and (
+        args.visuals in ("ai_image", "ai_video", "mixed") or args.voice_clone
+    )
+    if gpu_heavy:
+        jobs = 1
+    else:
+        # Each video already fans out across cores (scene threads, ffmpeg
+        # renders, a threads=0 export), so only a few run side by side
+        jobs = args.jobs or max(1, (os.cpu_count() or 2) // 4)
+    jobs = max(1, min(jobs, len(topics)))
 
     print("=" * 55)
     print("  ULTIMATE AI VIDEO CREATOR — BATCH MODE")
@@ -142,96 +365,82 @@ def main():
     if args.mode == "auto":
         print(f"  Brain:    {args.brain}")
         print(f"  Visuals:  {args.visuals}")
+    print(f"  Jobs:     {jobs}")
     print("=" * 55)
 
-    batch_start = time.time()
-    results = []
-
-    for i, topic in enumerate(topics):
-        print(f"\n{'#' * 55}")
-        print(f"  VIDEO {i+1}/{len(topics)}: {topic}")
-        print(f"{'#' * 55}")
-
-        # Build command args
-        cmd_args = [
-            sys.executable, os.path.join(PROJECT_ROOT, "generate.py"),
-            "--topic", topic,
-            "--mode", args.mode,
-            "--lang", args.lang,
-            "--duration", str(args.duration),
-            "--style", args.style,
-        ]
-        if args.no_music:
-            cmd_args.append("--no-music")
-        if args.no_subtitles:
-            cmd_args.append("--no-subtitles")
-
-        # NEW: Auto mode args
-        if args.mode == "auto":
-            cmd_args.extend(["--brain", args.brain])
-            cmd_args.extend(["--visuals", args.visuals])
-            if args.voice_clone:
-                cmd_args.append("--voice-clone")
-
-        # Run as subprocess to isolate memory
-        import subprocess
-        video_start = time.time()
+    output_dir = os.path.join(PROJECT_ROOT, "output")
+    os.makedirs(output_dir, exist_ok=True)
+    progress_path = os.path.join(output_dir, "batch_results.jsonl")
+    results_path = os.path.join(output_dir, "batch_results.json")
 
-        try:
-            result = subprocess.run(
-                cmd_args,
-                capture_output=True,
-                text=True,
-                cwd=PROJECT_ROOT,
-                timeout=300,  # 5 min timeout per video
-            )
-
-            video_time = time.time() - video_start
-
-            if result.returncode == 0:
-                # Extract output path from stdout
-                output_line = ""
-                for line in result.stdout.split("\n"):
-                    if "Output:" in line:
-                        output_line = line.strip()
-                        break
-
-                results.append({
-                    "topic": topic,
-                    "status": "success",
-                    "time": round(video_time, 1),
-                    "output": output_line,
-                })
-                print(f"  [OK] Completed in {video_time:.1f}s")
+    batch_start = time.perf_counter()
+    results = [None] * len(topics)
+    success = 0
+
+    # Default: warm worker processes that import the pipeline once and
+    # generate many videos. --isolate: one fresh interpreter per video.
+    isolate = args.isolate or not POOL_SUPPORTED
+    if isolate:
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        run_one = _run_one
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_warm_imports)
+        run_one = _run_one_pooled
+
+    # One JSON line per finished video, flushed as we go, so a crashed
+    # batch keeps its progress and can be tailed from another shell.
+    # Only the main process writes here, so no locking is needed.
+    with open(progress_path, "w", encoding="utf-8") as progress:
+        done = 0
+
+        def record(i, r):
+            nonlocal done, success
+            done += 1
+            results[i] = r
+            progress.write(json.dumps(_rounded_times(r)) + "\n")
+            progress.flush()
+            os.fsync(progress.fileno())
+
+            label = f"[{done}/{len(topics)}] {r['topic']}"
+            if r["status"] == "success":
+                success += 1
+                print(f"  [OK] {label} — completed in {r['time']:.1f}s")
+            elif r["status"] == "timeout":
+                print(f"  [TIMEOUT] {label} — exceeded {VIDEO_TIMEOUT // 60} minute limit")
             else:
-                results.append({
-                    "topic": topic,
-                    "status": "error",
-                    "time": round(video_time, 1),
-                    "error": result.stderr[-200:] if result.stderr else "Unknown error",
-                })
-                print(f"  [FAIL] Error after {video_time:.1f}s")
-                if result.stderr:
-                    print(f"  {result.stderr[-150:]}")
+                print(f"  [FAIL] {label}")
+                if r.get("error"):
+                    print(f"  {r['error'][-150:]}")
 
-        except subprocess.TimeoutExpired:
-            results.append({
-                "topic": topic,
-                "status": "timeout",
-                "time": 300,
-            })
-            print(f"  [TIMEOUT] Exceeded 5 minute limit")
-        except Exception as e:
-            results.append({
-                "topic": topic,
-                "status": "error",
-                "error": str(e),
-            })
-            print(f"  [ERROR] {e}")
+        # A worker killed mid-video (segfault, OOM) breaks the whole pool;
+        # its unfinished topics are retried below, each in its own process
+        retry = []
+        with executor:
+            futures = {
+                executor.submit(run_one, topic, args): i
+                for i, topic in enumerate(topics)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    r = future.result()
+                except BrokenProcessPool:
+                    retry.append(i)
+                    continue
+                except Exception as e:
+                    r = {"topic": topics[i], "status": "error",
+                         "error": f"{type(e).__name__}: {e}"[-200:]}
+                record(i, r)
+
+        if retry:
+            print(f"  [WARN] Worker pool crashed — retrying {len(retry)} video(s) isolated")
+            with ThreadPoolExecutor(max_workers=jobs) as isolated:
+                futures = {isolated.submit(_run_one, topics[i], args): i for i in retry}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
 
     # ===== SUMMARY =====
-    total_time = time.time() - batch_start
-    success = sum(1 for r in results if r["status"] == "success")
+    total_time = time.perf_counter() - batch_start
     failed = len(results) - success
 
     print(f"\n{'=' * 55}")
@@ -248,16 +457,17 @@ def main():
         status = "OK" if r["status"] == "success" else "FAIL"
         print(f"  [{status}] {r['topic']}")
 
-    # Save results to JSON
-    results_path = os.path.join(PROJECT_ROOT, "output", "batch_results.json")
-    with open(results_path, "w", encoding="utf-8") as f:
+    # Save the consolidated summary (atomically, replacing any earlier run)
+    tmp_path = f"{results_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump({
             "total": len(results),
             "success": success,
             "failed": failed,
             "total_time": round(total_time, 1),
-            "results": results,
+            "results": [_rounded_times(r) for r in results],
         }, f, indent=2)
+    os.replace(tmp_path, results_path)
     print(f"\n  Results saved to: {results_path}")
 
 
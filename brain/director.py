@@ -16,11 +16,51 @@ import json
 import os
 import sys
 import hashlib
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, BASE_DIR)
 
 from brain.storyboard import Storyboard, Scene, VisualType
+from utils.cache import ensure_cache_dir, is_cached
+
+# Maximum number of cached Claude storyboards kept in cache/storyboards/
+STORYBOARD_CACHE_MAX = 1000
+
+# Anthropic clients by API key — reused so batch runs keep one connection pool
+_CLIENT_CACHE = {}
+
+# Concurrent downloads for network-bound visuals (Pexels, Pollinations)
+STOCK_WORKERS = 8
+
+# Fixed part of the Claude storyboard prompt (schema + visual/transition types)
+_CLAUDE_PROMPT_SCHEMA = """Return a JSON object with this exact structure:
+{
+  "hook": "opening hook text (1-2 sentences, attention-grabbing)",
+  "scenes": [
+    {
+      "text": "narration text for this scene",
+      "duration": 8,
+      "visual_type": "stock_footage",
+      "visual_prompt": "search query or generation prompt for the visual",
+      "text_overlay": "short text to show on screen (max 50 chars)",
+      "transition_in": "crossfade"
+    }
+  ],
+  "cta": "call to action text",
+  "hashtags": ["#tag1", "#tag2"],
+  "music_mood": "inspiring"
+}
+
+Visual types explained:
+- stock_footage: search query for Pexels stock video
+- ai_generated_image: prompt for AI image generation (cinematic, detailed)
+- ai_generated_video: prompt for AI video generation (simple, clear motion)
+- text_animation: text to animate with kinetic typography
+- motion_graphic: text/stats for motion graphic overlay
+
+Transition types: crossfade, cut, fade_black, slide_left, zoom_in"""
 
 
 class Director:
@@ -33,6 +73,15 @@ class Director:
         output_path = director.execute_storyboard(storyboard, output_path)
     """
 
+    # Serial per-scene visual generators, by visual type (method names, so
+    # subclasses can override them). Stock footage is fetched concurrently in
+    # _generate_other_visuals; color backgrounds are drawn by the composer.
+    _VISUAL_HANDLERS = {
+        VisualType.INFOGRAPHIC: "_generate_infographic",
+        VisualType.MOTION_GRAPHIC: "_generate_motion",
+        VisualType.TEXT_ANIMATION: "_generate_text_animation",
+    }
+
     def __init__(self, config):
         self.config = config
         brain_config = config.get("brain", {})
@@ -40,6 +89,12 @@ class Director:
         self.claude_api_key = brain_config.get("claude_api_key", "")
         self.claude_model = brain_config.get("claude_model", "claude-sonnet-4-20250514")
         self.max_scenes = brain_config.get("max_scenes", 6)
+        self.use_brain_cache = brain_config.get("cache", True)
+
+        # Visual generators, created on first use and reused for every scene
+        self._stock_generator = None
+        self._infographic_renderer = None
+        self._motion_renderer = None
 
     def create_storyboard(self, topic, duration=30, language="en", style="education",
                           visual_mode="stock"):
@@ -81,8 +136,6 @@ class Director:
             print("   [Director] anthropic package not installed, falling back to template mode")
             return self._create_storyboard_template(topic, duration, language, style, visual_mode)
 
-        client = anthropic.Anthropic(api_key=self.claude_api_key)
-
         visual_types_available = ["stock_footage", "text_animation", "motion_graphic"]
         gen_config = self.config.get("generators", {})
         if gen_config.get("ai_image", {}).get("enabled"):
@@ -90,7 +143,8 @@ class Director:
         if gen_config.get("ai_video", {}).get("enabled"):
             visual_types_available.append("ai_generated_video")
 
-        prompt = f"""Create a short-form video storyboard for the topic: "{topic}"
+        prompt = "".join([
+            f"""Create a short-form video storyboard for the topic: "{topic}"
 
 Requirements:
 - Language: {language}
@@ -99,37 +153,37 @@ Requirements:
 - Maximum scenes: {self.max_scenes}
 - Available visual types: {', '.join(visual_types_available)}
 
-Return a JSON object with this exact structure:
-{{
-  "hook": "opening hook text (1-2 sentences, attention-grabbing)",
-  "scenes": [
-    {{
-      "text": "narration text for this scene",
-      "duration": 8,
-      "visual_type": "stock_footage",
-      "visual_prompt": "search query or generation prompt for the visual",
-      "text_overlay": "short text to show on screen (max 50 chars)",
-      "transition_in": "crossfade"
-    }}
-  ],
-  "cta": "call to action text",
-  "hashtags": ["#tag1", "#tag2"],
-  "music_mood": "inspiring"
-}}
-
-Visual types explained:
-- stock_footage: search query for Pexels stock video
-- ai_generated_image: prompt for AI image generation (cinematic, detailed)
-- ai_generated_video: prompt for AI video generation (simple, clear motion)
-- text_animation: text to animate with kinetic typography
-- motion_graphic: text/stats for motion graphic overlay
-
-Transition types: crossfade, cut, fade_black, slide_left, zoom_in
-
-Write the narration in {language}. Make it engaging, factual, and optimized for short-form video."""
+""",
+            _CLAUDE_PROMPT_SCHEMA,
+            f"""
+
+Write the narration in {language}. Make it engaging, factual, and optimized for short-form video.""",
+        ])
+
+        # Identical prompt + model -> reuse the earlier response (no API call)
+        cache_path = None
+        if self.use_brain_cache:
+            key = hashlib.sha256((self.claude_model + prompt).encode("utf-8")).hexdigest()
+            cache_path = os.path.join(ensure_cache_dir("storyboards"), f"{key}.json")
+            if is_cached(cache_path):
+                try:
+                    with open(cache_path, "r", encoding="utf-8") as f:
+                        storyboard_data = json.load(f)
+                    os.utime(cache_path)  # Mark as recently used for eviction
+                    print("   [Director] Using cached Claude storyboard")
+                    return self._storyboard_from_claude(
+                        storyboard_data, topic, language, style, duration
+                    )
+                except (OSError, ValueError):
+                    pass
 
         try:
             print("   [Director] Generating storyboard with Claude API...")
+            client = _CLIENT_CACHE.get(self.claude_api_key)
+            if client is None:
+                client = _CLIENT_CACHE[self.claude_api_key] = anthropic.Anthropic(
+                    api_key=self.claude_api_key
+                )
             message = client.messages.create(
                 model=self.claude_model,
                 max_tokens=2000,
@@ -142,12 +196,13 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
             json_start = response_text.find("{")
             json_end = response_text.rfind("}") + 1
             if json_start >= 0 and json_end > json_start:
-                storyboard_data = json.loads(response_text[json_start:json_end])
-                storyboard_data["topic"] = topic
-                storyboard_data["language"] = language
-                storyboard_data["style"] = style
-                storyboard_data["target_duration"] = duration
-                return Storyboard.from_dict(storyboard_data)
+                json_text = response_text[json_start:json_end]
+                storyboard_data = json.loads(json_text)
+                if cache_path:
+                    self._save_cached_storyboard(cache_path, json_text)
+                return self._storyboard_from_claude(
+                    storyboard_data, topic, language, style, duration
+                )
             else:
                 print("   [Director] Could not parse Claude response, falling back to template")
                 return self._create_storyboard_template(topic, duration, language, style, visual_mode)
@@ -156,13 +211,41 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
             print(f"   [Director] Claude API error: {e}, falling back to template")
             return self._create_storyboard_template(topic, duration, language, style, visual_mode)
 
+    def _storyboard_from_claude(self, storyboard_data, topic, language, style, duration):
+        """Build a Storyboard from Claude's JSON plus the request parameters."""
+        storyboard_data["topic"] = topic
+        storyboard_data["language"] = language
+        storyboard_data["style"] = style
+        storyboard_data["target_duration"] = duration
+        return Storyboard.from_dict(storyboard_data)
+
+    def _save_cached_storyboard(self, cache_path, json_text):
+        """Atomically write a Claude response to the cache and evict old entries."""
+        try:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json_text)
+            os.replace(tmp_path, cache_path)
+
+            # Keep the cache bounded: drop least recently used entries
+            cache_dir = os.path.dirname(cache_path)
+            with os.scandir(cache_dir) as it:
+                entries = [e for e in it if e.name.endswith(".json")]
+            excess = len(entries) - STORYBOARD_CACHE_MAX
+            if excess > 0:
+                entries.sort(key=lambda e: e.stat().st_mtime)
+                for e in entries[:excess]:
+                    os.remove(e.path)
+        except OSError as e:
+            print(f"   [Director] Could not cache storyboard: {e}")
+
     def execute_storyboard(self, storyboard, output_path, args=None):
         """
         Execute a storyboard — generate all assets and compose the final video.
 
         Pipeline:
         1. Generate audio (TTS) for all scenes
-        2. Generate AI images (if any) -> unload GPU
+        2. Generate AI images (if any) -> unload GPU only if AI videos follow
         3. Generate AI videos (if any) -> done with GPU
         4. Generate other visuals (stock, infographic, motion, text_animation)
         5. Compose final video
@@ -183,18 +266,20 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
         print("\n   [Director] Step 1: Generating audio...")
         self._generate_audio(storyboard)
 
-        # Step 2: Generate AI images (GPU intensive)
         ai_image_scenes = [s for s in storyboard.scenes
                           if s.visual_type == VisualType.AI_GENERATED_IMAGE]
+        ai_video_scenes = [s for s in storyboard.scenes
+                          if s.visual_type == VisualType.AI_GENERATED_VIDEO]
+
+        # Step 2: Generate AI images (GPU intensive)
         if ai_image_scenes:
             print(f"\n   [Director] Step 2: Generating {len(ai_image_scenes)} AI images...")
-            self._generate_ai_images(ai_image_scenes)
+            # Only free VRAM when Wan2GP needs it next; otherwise keep SDXL warm
+            self._generate_ai_images(ai_image_scenes, unload=bool(ai_video_scenes))
         else:
             print("\n   [Director] Step 2: No AI images needed, skipping")
 
         # Step 3: Generate AI videos (GPU intensive)
-        ai_video_scenes = [s for s in storyboard.scenes
-                          if s.visual_type == VisualType.AI_GENERATED_VIDEO]
         if ai_video_scenes:
             print(f"\n   [Director] Step 3: Generating {len(ai_video_scenes)} AI videos...")
             self._generate_ai_videos(ai_video_scenes)
@@ -208,6 +293,7 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
         # Step 5: Compose
         print("\n   [Director] Step 5: Composing final video...")
         from composer.timeline import build_video_from_storyboard
+        self._prefetch_assets(storyboard)
         result = build_video_from_storyboard(storyboard, output_path, self.config)
 
         return result
@@ -281,26 +367,49 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
             storyboard.scenes[0].audio_path = result["audio_path"]
             storyboard.scenes[0].audio_duration = result["duration"]
 
+    @staticmethod
+    def _prefetch_assets(storyboard):
+        """
+        Ask the kernel to start reading every scene asset before composing.
+
+        moviepy opens the clips one by one; WILLNEED hints queue readahead for
+        all of them up front so disk/network latency overlaps. No-op where
+        posix_fadvise is unavailable (Windows, macOS).
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        paths = {scene.visual_path for scene in storyboard.scenes if scene.visual_path}
+        if storyboard.scenes and storyboard.scenes[0].audio_path:
+            paths.add(storyboard.scenes[0].audio_path)
+
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
     def _distribute_timestamps(self, storyboard, word_timestamps):
         """Distribute word timestamps across scenes proportionally."""
         if not word_timestamps or not storyboard.scenes:
             return
 
-        # Simple approach: split by scene text word count
-        scene_word_counts = []
-        for scene in storyboard.scenes:
-            scene_word_counts.append(len(scene.text.split()))
-
-        # Include hook and cta
+        # Simple approach: split by scene text word count, skipping the hook
         hook_words = len(storyboard.hook.split()) if storyboard.hook else 0
-        cta_words = len(storyboard.cta.split()) if storyboard.cta else 0
+        total = len(word_timestamps)
+        bounds = [min(b, total) for b in itertools.accumulate(
+            (len(scene.text.split()) for scene in storyboard.scenes),
+            initial=hook_words,
+        )]
 
-        word_idx = hook_words  # Skip hook words
         for i, scene in enumerate(storyboard.scenes):
-            count = scene_word_counts[i]
-            end_idx = min(word_idx + count, len(word_timestamps))
-            scene.word_timestamps = word_timestamps[word_idx:end_idx]
-            word_idx = end_idx
+            scene.word_timestamps = word_timestamps[bounds[i]:bounds[i + 1]]
 
     def _get_voice_for_language(self, language):
         """Get default voice for a language from config."""
@@ -309,25 +418,44 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
         key = lang_map.get(language, "en_male")
         return voices.get(key, "en-US-GuyNeural")
 
-    def _generate_ai_images(self, scenes):
-        """Generate AI images for scenes that need them."""
+    def _generate_ai_images(self, scenes, unload=True):
+        """
+        Generate AI images for scenes that need them.
+
+        Args:
+            scenes: Scenes with AI_GENERATED_IMAGE visual type
+            unload: Free the model's VRAM afterwards (keep it loaded for reuse if False)
+        """
         try:
-            from generators.ai_image import get_image_generator
+            from generators.ai_image import get_image_generator, PollinationsImageGenerator
             gen_config = self.config.get("generators", {}).get("ai_image", {})
             generator = get_image_generator(gen_config)
 
-            for scene in scenes:
+            def _generate(scene):
                 print(f"   [Director] Generating AI image: {scene.visual_prompt[:50]}...")
-                path = generator.generate(scene.visual_prompt)
+                return generator.generate(scene.visual_prompt)
+
+            # API-backed generators are network-bound and can run concurrently;
+            # a local GPU pipeline takes the prompts in batches
+            if isinstance(generator, PollinationsImageGenerator) and len(scenes) > 1:
+                with ThreadPoolExecutor(max_workers=min(STOCK_WORKERS, len(scenes))) as pool:
+                    paths = list(pool.map(_generate, scenes))
+            elif hasattr(generator, "generate_many"):
+                paths = generator.generate_many([scene.visual_prompt for scene in scenes])
+            else:
+                paths = [_generate(scene) for scene in scenes]
+
+            for scene, path in zip(scenes, paths):
                 if path:
                     scene.visual_path = path
                 else:
                     # Fallback to stock footage
                     scene.visual_type = VisualType.STOCK_FOOTAGE
 
-            # Unload GPU to free VRAM for potential AI video generation
-            if hasattr(generator, 'unload'):
-                generator.unload()
+            # Free VRAM for AI video generation; parking keeps the weights
+            # in RAM so the next video doesn't reload the model from disk
+            if unload and hasattr(generator, 'park'):
+                generator.park()
 
         except Exception as e:
             print(f"   [Director] AI image generation failed: {e}")
@@ -337,9 +465,9 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
     def _generate_ai_videos(self, scenes):
         """Generate AI videos for scenes that need them."""
         try:
-            from generators.ai_video import Wan2GPVideoGenerator
+            from generators.ai_video import get_video_generator
             gen_config = self.config.get("generators", {}).get("ai_video", {})
-            generator = Wan2GPVideoGenerator(gen_config)
+            generator = get_video_generator(gen_config)
 
             for scene in scenes:
                 print(f"   [Director] Generating AI video: {scene.visual_prompt[:50]}...")
@@ -356,27 +484,26 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
 
     def _generate_other_visuals(self, storyboard):
         """Generate stock footage, infographics, motion graphics, text animations."""
-        for scene in storyboard.scenes:
-            if scene.visual_path:
-                continue  # Already generated (AI)
+        pending = [s for s in storyboard.scenes if not s.visual_path]  # Skip AI-generated
 
-            if scene.visual_type == VisualType.STOCK_FOOTAGE:
-                self._generate_stock(scene)
-            elif scene.visual_type == VisualType.INFOGRAPHIC:
-                self._generate_infographic(scene)
-            elif scene.visual_type == VisualType.MOTION_GRAPHIC:
-                self._generate_motion(scene)
-            elif scene.visual_type == VisualType.TEXT_ANIMATION:
-                self._generate_text_animation(scene)
-            elif scene.visual_type == VisualType.COLOR_BACKGROUND:
-                pass  # Handled by composer
+        # Stock footage is network-bound: fetch all scenes concurrently
+        stock_scenes = [s for s in pending if s.visual_type == VisualType.STOCK_FOOTAGE]
+        if stock_scenes:
+            with ThreadPoolExecutor(max_workers=min(STOCK_WORKERS, len(stock_scenes))) as pool:
+                list(pool.map(self._generate_stock, stock_scenes))
+
+        for scene in pending:
+            handler = self._VISUAL_HANDLERS.get(scene.visual_type)
+            if handler:
+                getattr(self, handler)(scene)
 
     def _generate_stock(self, scene):
         """Generate stock footage for a scene."""
         try:
-            from generators.stock import StockFootageGenerator
-            generator = StockFootageGenerator(self.config)
-            paths = generator.generate_for_scene(scene)
+            if self._stock_generator is None:
+                from generators.stock import StockFootageGenerator
+                self._stock_generator = StockFootageGenerator(self.config)
+            paths = self._stock_generator.generate_for_scene(scene)
             if paths:
                 scene.visual_path = paths[0]
         except ImportError:
@@ -392,9 +519,10 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
     def _generate_infographic(self, scene):
         """Generate animated infographic for a scene."""
         try:
-            from generators.infographic import InfographicRenderer
-            renderer = InfographicRenderer()
-            clip = renderer.render_for_scene(scene)
+            if self._infographic_renderer is None:
+                from generators.infographic import InfographicRenderer
+                self._infographic_renderer = InfographicRenderer()
+            clip = self._infographic_renderer.render_for_scene(scene)
             if clip is not None:
                 scene.visual_clip = clip
             else:
@@ -406,9 +534,7 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
     def _generate_motion(self, scene):
         """Generate animated motion graphic for a scene."""
         try:
-            from generators.motion import MotionGraphicsRenderer
-            renderer = MotionGraphicsRenderer()
-            clip = renderer.render_for_scene(scene)
+            clip = self._get_motion_renderer().render_for_scene(scene)
             if clip is not None:
                 scene.visual_clip = clip
             else:
@@ -417,12 +543,17 @@ Write the narration in {language}. Make it engaging, factual, and optimized for
             print(f"   [Director] Motion graphic failed: {e}, using fallback")
             self._generate_stock(scene)
 
+    def _get_motion_renderer(self):
+        """Motion graphics renderer, created on first use and shared by scene types."""
+        if self._motion_renderer is None:
+            from generators.motion import MotionGraphicsRenderer
+            self._motion_renderer = MotionGraphicsRenderer()
+        return self._motion_renderer
+
     def _generate_text_animation(self, scene):
         """Generate animated text animation for a scene."""
         try:
-            from generators.motion import MotionGraphicsRenderer
-            renderer = MotionGraphicsRenderer()
-            clip = renderer.render_for_scene(scene)
+            clip = self._get_motion_renderer().render_for_scene(scene)
             if clip is not None:
                 scene.visual_clip = clip
             else:
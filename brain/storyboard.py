@@ -8,10 +8,17 @@ A Storyboard contains a sequence of Scenes, each describing:
 - Visual parameters for the generator
 """
 
+import json
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
+# Optional: orjson serializes several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class VisualType(Enum):
     """Types of visual content a scene can contain."""
@@ -36,7 +43,15 @@ class TransitionType(Enum):
     ZOOM_OUT = "zoom_out"
 
 
-@dataclass
+# Enum -> serialized string, looked up directly instead of via Enum.value
+_VISUAL_TYPE_VALUES = {vt: vt.value for vt in VisualType}
+_TRANSITION_VALUES = {tt: tt.value for tt in TransitionType}
+
+# Visual types generated on the GPU (SDXL / Wan2GP)
+_GPU_TYPES = frozenset({VisualType.AI_GENERATED_VIDEO, VisualType.AI_GENERATED_IMAGE})
+
+
+@dataclass(slots=True)
 class Scene:
     """
     A single scene in the storyboard.
@@ -75,7 +90,7 @@ class Scene:
     word_timestamps: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Storyboard:
     """
     Complete video storyboard — the central data structure.
@@ -108,15 +123,11 @@ class Storyboard:
 
     def get_full_narration(self) -> str:
         """Get all narration text concatenated."""
-        parts = []
-        if self.hook:
-            parts.append(self.hook)
-        for scene in self.scenes:
-            if scene.text:
-                parts.append(scene.text)
-        if self.cta:
-            parts.append(self.cta)
-        return " ".join(parts)
+        return " ".join(
+            part
+            for part in (self.hook, *(scene.text for scene in self.scenes), self.cta)
+            if part
+        )
 
     def get_visual_types_used(self) -> set[VisualType]:
         """Get set of all visual types used in this storyboard."""
@@ -124,8 +135,7 @@ class Storyboard:
 
     def needs_gpu(self) -> bool:
         """Check if this storyboard requires GPU for visual generation."""
-        gpu_types = {VisualType.AI_GENERATED_VIDEO, VisualType.AI_GENERATED_IMAGE}
-        return bool(self.get_visual_types_used() & gpu_types)
+        return any(scene.visual_type in _GPU_TYPES for scene in self.scenes)
 
     def to_dict(self) -> dict:
         """Serialize storyboard to dict (for JSON/logging)."""
@@ -139,10 +149,10 @@ class Storyboard:
                 {
                     "text": s.text,
                     "duration": s.duration,
-                    "visual_type": s.visual_type.value,
+                    "visual_type": _VISUAL_TYPE_VALUES[s.visual_type],
                     "visual_prompt": s.visual_prompt,
                     "visual_params": s.visual_params,
-                    "transition_in": s.transition_in.value,
+                    "transition_in": _TRANSITION_VALUES[s.transition_in],
                     "text_overlay": s.text_overlay,
                 }
                 for s in self.scenes
@@ -152,6 +162,12 @@ class Storyboard:
             "music_mood": self.music_mood,
         }
 
+    def to_json(self) -> str:
+        """Serialize storyboard to a JSON string (orjson if installed)."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode("utf-8")
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
     @classmethod
     def from_dict(cls, data: dict) -> "Storyboard":
         """Deserialize storyboard from dict."""
@@ -165,17 +181,20 @@ class Storyboard:
             hashtags=data.get("hashtags", []),
             music_mood=data.get("music_mood", "inspiring"),
         )
-        for scene_data in data.get("scenes", []):
-            scene = Scene(
-                text=scene_data.get("text", ""),
-                duration=scene_data.get("duration", 8.0),
-                visual_type=VisualType(scene_data.get("visual_type", "stock_footage")),
-                visual_prompt=scene_data.get("visual_prompt", ""),
-                visual_params=scene_data.get("visual_params", {}),
-                transition_in=TransitionType(scene_data.get("transition_in", "crossfade")),
-                text_overlay=scene_data.get("text_overlay", ""),
-            )
-            sb.add_scene(scene)
+        # Equivalent to add_scene() per scene, without re-measuring the list
+        scenes = sb.scenes
+        for i, scene_data in enumerate(data.get("scenes", ())):
+            get = scene_data.get
+            scenes.append(Scene(
+                text=get("text", ""),
+                duration=get("duration", 8.0),
+                visual_type=VisualType(get("visual_type", "stock_footage")),
+                visual_prompt=get("visual_prompt", ""),
+                visual_params=get("visual_params", {}),
+                transition_in=TransitionType(get("transition_in", "crossfade")),
+                text_overlay=get("text_overlay", ""),
+                scene_index=i,
+            ))
         return sb
 
     def to_legacy_script(self) -> dict:
@@ -6,23 +6,37 @@ but outputs Storyboard objects instead of raw dicts.
 This is the "free" brain mode — no API calls needed.
 """
 
+import functools
 import json
 import os
 import random
+from types import MappingProxyType
 
 from brain.storyboard import Scene, Storyboard, VisualType, TransitionType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
 
 
+@functools.lru_cache(maxsize=None)
 def _load_json(filename):
-    """Load a JSON file from templates directory."""
+    """
+    Load a JSON file from templates directory (parsed once per process).
+
+    The result is shared between callers and wrapped read-only; call
+    _load_json.cache_clear() to pick up edited template files.
+    """
     path = os.path.join(TEMPLATES_DIR, filename)
     if not os.path.exists(path):
-        return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return MappingProxyType({})
+    with open(path, "rb") as f:
+        raw = f.read()
+    return MappingProxyType(orjson.loads(raw) if orjson is not None else json.loads(raw))
 
 
 def _load_storyboard_patterns():
@@ -50,6 +64,21 @@ TRANSITION_MAP = {
     "zoom_in": TransitionType.ZOOM_IN,
 }
 
+# Scene transitions, cycled in order
+TRANSITION_SEQUENCE = (
+    TransitionType.CROSSFADE,
+    TransitionType.CUT,
+    TransitionType.FADE_BLACK,
+    TransitionType.CROSSFADE,
+    TransitionType.ZOOM_IN,
+    TransitionType.SLIDE_LEFT,
+)
+
+# Randomly picked effect parameters per visual type
+TEXT_EFFECTS = ("typewriter", "fade_words", "slide_in", "kinetic_typography")
+MOTION_EFFECTS = ("lower_third", "title_card", "counter")
+CHART_TYPES = ("bar_chart", "statistics", "comparison")
+
 
 def generate_storyboard(
     topic,
@@ -122,16 +151,6 @@ def generate_storyboard(
     # Determine visual type per scene based on visual_mode
     visual_types = _get_visual_sequence(visual_mode, num_segments, style)
 
-    # Transitions sequence
-    transitions = [
-        TransitionType.CROSSFADE,
-        TransitionType.CUT,
-        TransitionType.FADE_BLACK,
-        TransitionType.CROSSFADE,
-        TransitionType.ZOOM_IN,
-        TransitionType.SLIDE_LEFT,
-    ]
-
     # Build storyboard
     sb = Storyboard(
         topic=topic,
@@ -148,9 +167,10 @@ def generate_storyboard(
     for i, (fact_text, explanation, visual_query) in enumerate(facts):
         text = fact_text.replace("{topic}", topic)
         detail = explanation
+        short_text = text[:50] + ("..." if len(text) > 50 else "")
 
         vtype = visual_types[i % len(visual_types)]
-        transition = transitions[i % len(transitions)]
+        transition = TRANSITION_SEQUENCE[i % len(TRANSITION_SEQUENCE)]
 
         # Build visual prompt based on type
         if vtype == VisualType.STOCK_FOOTAGE:
@@ -169,14 +189,13 @@ def generate_storyboard(
         # Visual params
         visual_params = {}
         if vtype == VisualType.TEXT_ANIMATION:
-            effects = ["typewriter", "fade_words", "slide_in", "kinetic_typography"]
-            visual_params["effect"] = random.choice(effects)
-            visual_params["text"] = text[:50] + ("..." if len(text) > 50 else "")
+            visual_params["effect"] = random.choice(TEXT_EFFECTS)
+            visual_params["text"] = short_text
         elif vtype == VisualType.MOTION_GRAPHIC:
-            visual_params["effect"] = random.choice(["lower_third", "title_card", "counter"])
-            visual_params["text"] = text[:50] + ("..." if len(text) > 50 else "")
+            visual_params["effect"] = random.choice(MOTION_EFFECTS)
+            visual_params["text"] = short_text
         elif vtype == VisualType.INFOGRAPHIC:
-            visual_params["chart_type"] = random.choice(["bar_chart", "statistics", "comparison"])
+            visual_params["chart_type"] = random.choice(CHART_TYPES)
             visual_params["title"] = topic
             visual_params["data_label"] = text[:40]
 
@@ -187,7 +206,7 @@ def generate_storyboard(
             visual_prompt=visual_prompt,
             visual_params=visual_params,
             transition_in=transition,
-            text_overlay=text[:50] + ("..." if len(text) > 50 else ""),
+            text_overlay=short_text,
         )
         sb.add_scene(scene)
 
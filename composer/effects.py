@@ -12,10 +12,60 @@ from moviepy import vfx, VideoClip
 from brain.storyboard import TransitionType
 from utils.animation import ease_out_cubic
 
+# Optional: OpenCV resizes NumPy frames directly (SIMD, no PIL round-trip)
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+def _resize(frame, size):
+    """Resize an RGB frame to size=(w, h) — OpenCV if available, else PIL LANCZOS."""
+    if cv2 is not None:
+        h, w = frame.shape[:2]
+        shrinking = size[0] < w
+        return cv2.resize(frame, size,
+                          interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
+    return np.array(Image.fromarray(frame).resize(size, Image.LANCZOS))
+
+
+def _fade(frame, alpha):
+    """
+    Scale a uint8 frame's brightness by alpha (0..1).
+
+    Without OpenCV the frame is scaled in place by a single ufunc pass
+    (no full-size float temporary), so only pass frames the caller owns.
+    """
+    if alpha >= 1.0:
+        return frame
+    if cv2 is not None:
+        return cv2.convertScaleAbs(frame, alpha=alpha)
+    np.multiply(frame, alpha, out=frame, casting="unsafe")
+    return frame
+
 
 class TransitionEngine:
     """Applies transitions between video clips."""
 
+    # Transition-in handlers: (engine, clip, duration) -> clip.
+    # Unknown types fall back to a crossfade.
+    _IN_HANDLERS = {
+        TransitionType.CROSSFADE: lambda self, clip, d: clip.with_effects([vfx.CrossFadeIn(d)]),
+        TransitionType.FADE_BLACK: lambda self, clip, d: clip.with_effects([vfx.FadeIn(d)]),
+        TransitionType.CUT: lambda self, clip, d: clip,  # No transition
+        TransitionType.SLIDE_LEFT: lambda self, clip, d: self._apply_slide(clip, d, direction="right"),
+        TransitionType.SLIDE_RIGHT: lambda self, clip, d: self._apply_slide(clip, d, direction="left"),
+        TransitionType.ZOOM_IN: lambda self, clip, d: self._apply_zoom_in(clip, d),
+        TransitionType.ZOOM_OUT: lambda self, clip, d: self._apply_zoom_out(clip, d),
+    }
+
+    # Transition-out handlers; anything else crossfades out
+    _OUT_HANDLERS = {
+        TransitionType.CROSSFADE: lambda self, clip, d: clip.with_effects([vfx.CrossFadeOut(d)]),
+        TransitionType.FADE_BLACK: lambda self, clip, d: clip.with_effects([vfx.FadeOut(d)]),
+        TransitionType.CUT: lambda self, clip, d: clip,
+    }
+
     def apply_transition(self, clip, transition_type, duration=0.5):
         """
         Apply a transition-in effect to a clip.
@@ -31,30 +81,9 @@ class TransitionEngine:
         if duration <= 0:
             return clip
 
+        handler = self._IN_HANDLERS.get(transition_type, self._IN_HANDLERS[TransitionType.CROSSFADE])
         try:
-            if transition_type == TransitionType.CROSSFADE:
-                return clip.with_effects([vfx.CrossFadeIn(duration)])
-
-            elif transition_type == TransitionType.FADE_BLACK:
-                return clip.with_effects([vfx.FadeIn(duration)])
-
-            elif transition_type == TransitionType.CUT:
-                return clip  # No transition
-
-            elif transition_type == TransitionType.SLIDE_LEFT:
-                return self._apply_slide(clip, duration, direction="right")
-
-            elif transition_type == TransitionType.SLIDE_RIGHT:
-                return self._apply_slide(clip, duration, direction="left")
-
-            elif transition_type == TransitionType.ZOOM_IN:
-                return self._apply_zoom_in(clip, duration)
-
-            elif transition_type == TransitionType.ZOOM_OUT:
-                return self._apply_zoom_out(clip, duration)
-
-            else:
-                return clip.with_effects([vfx.CrossFadeIn(duration)])
+            return handler(self, clip, duration)
         except Exception:
             return clip
 
@@ -63,15 +92,9 @@ class TransitionEngine:
         if duration <= 0:
             return clip
 
+        handler = self._OUT_HANDLERS.get(transition_type, self._OUT_HANDLERS[TransitionType.CROSSFADE])
         try:
-            if transition_type == TransitionType.CROSSFADE:
-                return clip.with_effects([vfx.CrossFadeOut(duration)])
-            elif transition_type == TransitionType.FADE_BLACK:
-                return clip.with_effects([vfx.FadeOut(duration)])
-            elif transition_type == TransitionType.CUT:
-                return clip
-            else:
-                return clip.with_effects([vfx.CrossFadeOut(duration)])
+            return handler(self, clip, duration)
         except Exception:
             return clip
 
@@ -81,35 +104,22 @@ class TransitionEngine:
 
         direction="right" means content slides in from the right edge (SLIDE_LEFT).
         direction="left" means content slides in from the left edge (SLIDE_RIGHT).
+
+        Implemented as an animated position, so the CompositeVideoClip blits
+        the frame at an offset (the uncovered strip shows the layer below)
+        instead of running a per-frame pixel callback.
         """
         try:
             W, H = clip.size
-            clip_duration = clip.duration
-            original_start = clip.start if hasattr(clip, 'start') else 0
-
-            def slide_filter(get_frame, t):
-                frame = get_frame(t)
-                if t > duration:
-                    return frame
+            sign = 1 if direction == "right" else -1
 
+            def slide_position(t):
+                if t >= duration:
+                    return (0, 0)
                 progress = ease_out_cubic(t / duration)
+                return (sign * int(W * (1.0 - progress)), 0)
 
-                if direction == "right":
-                    # Slide from right
-                    offset = int(W * (1.0 - progress))
-                    result = np.zeros_like(frame)
-                    if offset < W:
-                        result[:, :W - offset] = frame[:, offset:]
-                else:
-                    # Slide from left
-                    offset = int(W * (1.0 - progress))
-                    result = np.zeros_like(frame)
-                    if offset < W:
-                        result[:, offset:] = frame[:, :W - offset]
-
-                return result
-
-            return clip.transform(slide_filter)
+            return clip.with_position(slide_position)
         except Exception:
             return clip.with_effects([vfx.CrossFadeIn(duration)])
 
@@ -133,20 +143,17 @@ class TransitionEngine:
                 new_w = max(1, int(W * scale))
                 new_h = max(1, int(H * scale))
 
-                pil_img = Image.fromarray(frame)
-                pil_img = pil_img.resize((new_w, new_h), Image.LANCZOS)
-
-                # Center on black canvas
+                # Center on a fresh black canvas (MoviePy and iter_frames
+                # consumers may keep earlier frames, so none is reused)
                 result = np.zeros_like(frame)
                 x_off = (W - new_w) // 2
                 y_off = (H - new_h) // 2
 
                 # Paste centered
-                result[y_off:y_off + new_h, x_off:x_off + new_w] = np.array(pil_img)
+                result[y_off:y_off + new_h, x_off:x_off + new_w] = _resize(frame, (new_w, new_h))
 
                 # Apply alpha
-                result = (result * alpha).astype(np.uint8)
-                return result
+                return _fade(result, alpha)
 
             return clip.transform(zoom_filter)
         except Exception:
@@ -168,21 +175,28 @@ class TransitionEngine:
                 scale = 1.5 - 0.5 * progress  # 1.5 -> 1.0
                 alpha = min(1.0, progress * 1.5)
 
+                if cv2 is not None:
+                    # Scale about the center straight into a W x H frame
+                    # (one pass, no oversized intermediate to crop)
+                    M = np.float32([
+                        [scale, 0, (W - W * scale) / 2],
+                        [0, scale, (H - H * scale) / 2],
+                    ])
+                    result = cv2.warpAffine(frame, M, (W, H), flags=cv2.INTER_LINEAR)
+                    return _fade(result, alpha)
+
                 # Scale the frame (larger than target)
                 new_w = max(1, int(W * scale))
                 new_h = max(1, int(H * scale))
 
-                pil_img = Image.fromarray(frame)
-                pil_img = pil_img.resize((new_w, new_h), Image.LANCZOS)
+                resized = _resize(frame, (new_w, new_h))
 
                 # Crop center to target size
                 x_off = (new_w - W) // 2
                 y_off = (new_h - H) // 2
-                pil_img = pil_img.crop((x_off, y_off, x_off + W, y_off + H))
+                result = resized[y_off:y_off + H, x_off:x_off + W]
 
-                result = np.array(pil_img)
-                result = (result * alpha).astype(np.uint8)
-                return result
+                return _fade(result, alpha)
 
             return clip.transform(zoom_filter)
         except Exception:
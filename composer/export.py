@@ -1,12 +1,103 @@
 """
 Video export — final render and file writing.
 Wraps the MoviePy write_videofile call with standard settings.
+
+Uses a hardware H.264 encoder (NVENC, then VA-API) when one actually works
+on this machine, falling back to libx264.
 """
 
+import functools
 import os
+import subprocess
+import sys
+
+# Hardware encoders tried in order by video.hw_encoder: "auto".
+# Each entry: (codec, preset, extra ffmpeg params). MoviePy always passes
+# -preset, so every encoder gets one (VA-API ignores it). MoviePy pipes
+# rgb24 frames and only forces yuv420p for libx264, so NVENC needs it
+# explicitly (otherwise it may pick a 4:4:4 profile phones won't play);
+# VA-API converts through format=nv12.
+HW_ENCODERS = (
+    ("h264_nvenc", "p4", ["-tune", "hq", "-rc", "vbr", "-pix_fmt", "yuv420p"]),
+    ("h264_vaapi", "medium", ["-vaapi_device", "/dev/dri/renderD128",
+                              "-vf", "format=nv12,hwupload"]),
+)
+
+
+def _ffmpeg_binary():
+    """Path to the ffmpeg used by MoviePy."""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+@functools.lru_cache(maxsize=None)
+def _encoder_works(codec, preset, params):
+    """
+    Check a hardware encoder by encoding a few blank frames (cached per process).
+
+    Listing `ffmpeg -encoders` is not enough: NVENC/VA-API are often compiled
+    in without a usable GPU or driver behind them. The frames are piped as
+    raw rgb24, exactly as MoviePy sends them during export.
+    """
+    size, frames = 256, 6
+    cmd = [
+        _ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{size}x{size}", "-r", "30",
+        "-i", "-",
+        "-c:v", codec, "-preset", preset,
+        *params,
+        "-f", "null", "-",
+    ]
+
+    try:
+        result = subprocess.run(cmd, input=bytes(size * size * 3 * frames),
+                                capture_output=True, timeout=20)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def select_encoder(video_config):
+    """
+    Pick the video encoder for export.
+
+    Args:
+        video_config: config["video"] dict. hw_encoder is "auto" (probe
+            HW_ENCODERS), "off", or a specific codec name from HW_ENCODERS.
+
+    Returns:
+        (codec, preset, ffmpeg_params) tuple
+    """
+    software = (video_config.get("codec", "libx264"), video_config.get("preset", "veryfast"), [])
 
+    hw_encoder = video_config.get("hw_encoder", "auto")
+    if not hw_encoder or hw_encoder == "off":
+        return software
 
-def export_video(final_clip, output_path, config):
+    for codec, preset, params in HW_ENCODERS:
+        if hw_encoder not in ("auto", codec):
+            continue
+        if codec == "h264_vaapi" and not sys.platform.startswith("linux"):
+            continue
+        if _encoder_works(codec, preset, tuple(params)):
+            return codec, preset, list(params)
+
+    return software
+
+
+def _quality_params(codec, crf):
+    """ffmpeg params for constant-quality encoding with the given codec."""
+    if codec == "h264_nvenc":
+        return ["-cq", str(crf), "-b:v", "0"]
+    if codec == "h264_vaapi":
+        return ["-rc_mode", "CQP", "-qp", str(crf)]
+    return ["-crf", str(crf)]
+
+
+def export_video(final_clip, output_path, config, threads=None):
     """
     Export the final composed video to file.
 
@@ -14,19 +105,30 @@ def export_video(final_clip, output_path, config):
         final_clip: CompositeVideoClip ready to render
         output_path: Output MP4 path
         config: Config dict with video settings
+        threads: Encoder threads; None = video.threads from config
+            (0 lets the encoder use every core)
 
     Returns:
         Path to output video
     """
     video_config = config.get("video", {})
     FPS = video_config.get("fps", 30)
-    codec = video_config.get("codec", "libx264")
+    codec, preset, ffmpeg_params = select_encoder(video_config)
     audio_codec = video_config.get("audio_codec", "aac")
-    bitrate = video_config.get("bitrate", "4M")
+    if threads is None:
+        threads = video_config.get("threads", 0)
+
+    # Default: single-pass constant quality. "bitrate" targets an exact rate
+    # for platforms that require one.
+    if video_config.get("quality_mode", "crf") == "bitrate":
+        bitrate = video_config.get("bitrate", "4M")
+    else:
+        bitrate = None
+        ffmpeg_params = ffmpeg_params + _quality_params(codec, video_config.get("crf", 23))
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    print(f"   [Export] Rendering to {output_path}...")
+    print(f"   [Export] Rendering to {output_path} ({codec})...")
 
     final_clip.write_videofile(
         output_path,
@@ -34,8 +136,9 @@ def export_video(final_clip, output_path, config):
         codec=codec,
         audio_codec=audio_codec,
         bitrate=bitrate,
-        preset="medium",
-        threads=4,
+        preset=preset,
+        threads=threads,
+        ffmpeg_params=ffmpeg_params or None,
         logger="bar",
     )
 
@@ -0,0 +1,110 @@
+"""
+FFmpeg scene track — assembles the scene visuals in one filter_complex.
+
+When every scene is backed by a file (stock video or a Ken Burns render)
+and only fades in, ffmpeg can scale/crop, trim, loop, fade and overlay the
+scenes itself. The timeline then loads the result as a single clip instead
+of compositing N scene layers through MoviePy's per-frame Python blits.
+Anything else (animated Python clips, slide/zoom transitions) keeps the
+MoviePy path.
+"""
+
+import os
+import subprocess
+import tempfile
+
+from brain.storyboard import TransitionType
+from composer.export import _ffmpeg_binary
+from utils.cache import ensure_cache_dir, is_cached
+
+# Transitions expressible as an alpha fade-in over the background
+# (CUT has no fade). Both fades in MoviePy also start from the dark bg.
+FADE_TRANSITIONS = frozenset({
+    TransitionType.CUT,
+    TransitionType.CROSSFADE,
+    TransitionType.FADE_BLACK,
+})
+
+
+def build_scene_graph(segments, W, H, fps, total_duration, bg_color="0x0a0a0f"):
+    """
+    Build the filter_complex for a scene track.
+
+    Args:
+        segments: List of (path, start, duration, fade) tuples; input i of
+            the command is segments[i]. fade is the fade-in length (0 = cut).
+        W, H: Output size
+        fps: Output frame rate
+        total_duration: Track length in seconds
+        bg_color: Color shown where no scene is playing
+
+    Returns:
+        filter_complex string, output labelled [out]
+    """
+    chains = [f"color=c={bg_color}:s={W}x{H}:r={fps}:d={total_duration:.3f}[b0]"]
+
+    for i, (_, start, duration, fade) in enumerate(segments):
+        # Cover-fit, then shift the trimmed scene to its start on the timeline
+        chain = (
+            f"[{i}:v]scale={W}:{H}:force_original_aspect_ratio=increase,"
+            f"crop={W}:{H},setsar=1,fps={fps},"
+            f"trim=duration={duration:.3f},setpts=PTS-STARTPTS+{start:.3f}/TB"
+        )
+        if fade > 0:
+            chain += f",format=yuva420p,fade=t=in:st={start:.3f}:d={fade:.3f}:alpha=1"
+        chains.append(f"{chain}[s{i}]")
+
+    for i, (_, start, duration, _) in enumerate(segments):
+        chains.append(
+            f"[b{i}][s{i}]overlay=eof_action=pass:"
+            f"enable='between(t,{start:.3f},{start + duration:.3f})'[b{i + 1}]"
+        )
+
+    chains.append(f"[b{len(segments)}]format=yuv420p[out]")
+    return ";".join(chains)
+
+
+def compose_scene_track(segments, W, H, fps, total_duration):
+    """
+    Render the scene track to a temporary MP4 in cache/scene_track/.
+
+    Inputs are looped (-stream_loop -1), so clips shorter than their scene
+    repeat the same way the MoviePy path loops them. The track is only an
+    intermediate for one export, so it is not cached: the caller deletes
+    the file once the final video is written.
+
+    Args:
+        segments: See build_scene_graph
+        W, H, fps, total_duration: Output geometry and length
+
+    Returns:
+        Path to the MP4, or None if ffmpeg failed
+    """
+    graph = build_scene_graph(segments, W, H, fps, total_duration)
+
+    inputs = []
+    for path, _, _, _ in segments:
+        inputs += ["-stream_loop", "-1", "-i", path]
+
+    fd, out_path = tempfile.mkstemp(prefix="track_", suffix=".mp4", dir=ensure_cache_dir("scene_track"))
+    os.close(fd)
+    cmd = [
+        _ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error",
+        *inputs,
+        "-filter_complex", graph,
+        "-map", "[out]",
+        "-t", f"{total_duration:.3f}",
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+        "-threads", "0", "-an",
+        "-f", "mp4", out_path,
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        if result.returncode == 0 and is_cached(out_path):
+            return out_path
+        print(f"   [Timeline] ffmpeg scene track failed: {result.stderr.strip()[-200:]}")
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"   [Timeline] ffmpeg scene track failed: {e}")
+    os.remove(out_path)
+    return None
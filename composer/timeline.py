@@ -5,19 +5,23 @@ Takes a completed Storyboard (with visual_path and audio filled in)
 and builds the final composited video.
 """
 
+import math
 import os
 import random
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from PIL import Image
 from moviepy import (
     VideoFileClip, AudioFileClip, ImageClip, TextClip,
     CompositeVideoClip, CompositeAudioClip, ColorClip, VideoClip,
-    concatenate_videoclips, concatenate_audioclips,
     vfx, afx,
 )
-from utils.animation import ease_in_out_cubic, smooth_step
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+from utils.animation import ease_in_out_cubic
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, BASE_DIR)
@@ -30,27 +34,115 @@ try:
 except ImportError:
     pass
 
+# Optional: OpenCV resizes NumPy frames directly (no PIL round-trip)
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Optional: SIMD (SSE4.1/AVX2/NEON) Lanczos resizer, much faster than PIL's
+try:
+    from cykooz_resizer import CropBox, FilterType, ResizeAlg, ResizeOptions, Resizer
+    _LANCZOS3 = ResizeAlg.convolution(FilterType.lanczos3)
+except ImportError:
+    Resizer = None
+
+# Resizer instances are not shareable across threads; one per thread
+_resizers = threading.local()
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".webm")
+
+# Max threads preparing scene clips (image decode/resize, Ken Burns renders)
+SCENE_WORKERS = os.cpu_count() or 4
+
 from brain.storyboard import Storyboard, VisualType, TransitionType
 from composer.effects import TransitionEngine
-from composer.export import export_video
+from composer.export import export_video, _ffmpeg_binary
+from composer.ffmpeg_compose import FADE_TRANSITIONS, compose_scene_track
+from utils.cache import ensure_cache_dir, get_cache_path, hash_file, is_cached
+
+
+def _cover_size(w, h, target_w, target_h):
+    """Smallest size with w:h aspect that covers target_w x target_h."""
+    clip_ratio = w / h
+    if clip_ratio > target_w / target_h:
+        return round(clip_ratio * target_h), target_h
+    return target_w, round(target_w / clip_ratio)
+
+
+def _open_video(path, W, H):
+    """
+    Open a video clip, letting ffmpeg downscale large sources while decoding.
+
+    Stock footage is often 4K; when it is bigger than needed to cover W x H,
+    the clip is opened with target_resolution so ffmpeg's scaler shrinks
+    frames before they are piped into Python. The size comes from a header
+    probe, so only one reader process is ever started.
+    """
+    target = None
+    try:
+        infos = ffmpeg_parse_infos(path)
+        w, h = infos.get("video_size") or (0, 0)
+        if abs(infos.get("video_rotation", 0)) in (90, 270):
+            w, h = h, w
+        if w and h:
+            cover = _cover_size(w, h, W, H)
+            if cover[0] < w:
+                target = cover
+    except Exception:
+        pass  # let VideoFileClip report unreadable files
+    return VideoFileClip(path, audio=False, target_resolution=target)
 
 
 def _resize_to_fill(clip, target_w, target_h):
-    """Resize clip to fill target dimensions (CSS object-fit: cover)."""
+    """
+    Resize clip to fill target dimensions (CSS object-fit: cover).
+
+    Uses OpenCV (Lanczos4 up, area down) when installed, else MoviePy's
+    PIL-based resize + crop.
+    """
     if clip.w == 0 or clip.h == 0:
         return clip.resized((target_w, target_h))
 
+    # Pre-rendered at the output size (infographics, motion graphics, Ken
+    # Burns renders): nothing to resize or crop
+    if clip.w == target_w and clip.h == target_h:
+        return clip
+
     clip_ratio = clip.w / clip.h
     target_ratio = target_w / target_h
+    new_w, new_h = _cover_size(clip.w, clip.h, target_w, target_h)
+
+    if (new_w, new_h) == tuple(clip.size):
+        # Already cover-sized (e.g. scaled by the video reader): crop only
+        return clip.cropped(
+            x_center=new_w / 2,
+            y_center=new_h / 2,
+            width=target_w,
+            height=target_h,
+        )
 
-    if clip_ratio > target_ratio:
-        new_h = target_h
-        new_w = int(clip_ratio * target_h)
-    else:
-        new_w = target_w
-        new_h = int(target_w / clip_ratio)
+    if cv2 is not None:
+        # Crop the source to the target aspect, then one OpenCV resize
+        # straight to the target size (no PIL round-trip, no oversized frame)
+        if clip_ratio > target_ratio:
+            crop_w, crop_h = max(1, round(clip.h * target_ratio)), clip.h
+        else:
+            crop_w, crop_h = clip.w, max(1, round(clip.w / target_ratio))
+        x1 = (clip.w - crop_w) // 2
+        y1 = (clip.h - crop_h) // 2
+        interpolation = cv2.INTER_AREA if crop_w > target_w else cv2.INTER_LANCZOS4
+
+        def fill(frame):
+            return cv2.resize(frame[y1:y1 + crop_h, x1:x1 + crop_w],
+                              (target_w, target_h), interpolation=interpolation)
+
+        return clip.image_transform(fill, apply_to=["mask"])
 
     resized = clip.resized((new_w, new_h))
+    if (new_w, new_h) == (target_w, target_h):
+        return resized
     return resized.cropped(
         x_center=new_w / 2,
         y_center=new_h / 2,
@@ -59,11 +151,139 @@ def _resize_to_fill(clip, target_w, target_h):
     )
 
 
-def _apply_ken_burns(clip, duration, W, H):
+# Ken Burns moves as ffmpeg zoompan (zoom, x, y) expressions; {p} is the
+# eased 0..1 progress. Mirrors the Python fallback in _ken_burns_frames.
+_KEN_BURNS_ZOOMPAN = {
+    "zoom_in": ("1+0.15*{p}", "iw/2-(iw/zoom/2)", "ih/2-(ih/zoom/2)"),
+    "zoom_out": ("1.15-0.15*{p}", "iw/2-(iw/zoom/2)", "ih/2-(ih/zoom/2)"),
+    "pan_left": ("1.05", "(iw-iw/zoom)*(1-{p})", "ih/2-(ih/zoom/2)"),
+    "pan_right": ("1.05", "(iw-iw/zoom)*{p}", "ih/2-(ih/zoom/2)"),
+    "diagonal": ("1+0.1*{p}", "(iw-iw/zoom)*{p}*0.6", "(ih-ih/zoom)*{p}*0.6"),
+}
+KEN_BURNS_EFFECTS = tuple(_KEN_BURNS_ZOOMPAN)
+
+
+def _lanczos_resize(pil_img, size, box=None):
+    """
+    Lanczos-resize an RGB PIL image, or just the region box=(x, y, w, h) of it.
+
+    Uses cykooz_resizer when installed, else PIL; either way the crop is
+    part of the resize (no intermediate cropped image).
+    """
+    if Resizer is not None:
+        resizer = getattr(_resizers, "resizer", None)
+        if resizer is None:
+            resizer = _resizers.resizer = Resizer()
+        dst = Image.new("RGB", size)
+        options = ResizeOptions(
+            resize_alg=_LANCZOS3,
+            crop_box=CropBox(*box) if box else None,
+        )
+        resizer.resize_pil(pil_img, dst, options)
+        return dst
+
+    if box:
+        x, y, w, h = box
+        return pil_img.resize(size, Image.LANCZOS, box=(x, y, x + w, y + h))
+    return pil_img.resize(size, Image.LANCZOS)
+
+
+def _apply_ken_burns(image_path, duration, W, H, fps=30):
+    """
+    Build a static image scene with a Ken Burns (pan/zoom) effect.
+
+    Chooses one of 5 effects: zoom_in, zoom_out, pan_left, pan_right, diagonal,
+    seeded by the image hash so re-running a storyboard hits the cache. The
+    move is rendered once by ffmpeg's zoompan filter straight from the image
+    file (cached in cache/kenburns/ by image content) and loaded as a video
+    clip, so no Python callback runs per frame. Only if that fails is the
+    image decoded and cover-resized here for the PIL crop/resize fallback.
+    """
+    rendered, effect = _ken_burns_source(image_path, duration, W, H, fps)
+    if rendered:
+        try:
+            return VideoFileClip(rendered, audio=False).with_duration(duration)
+        except Exception as e:
+            print(f"   [Timeline] Could not load Ken Burns render: {e}")
+
+    clip = _resize_to_fill(ImageClip(image_path).with_duration(duration), W, H)
+    return _ken_burns_frames(clip, effect, duration, W, H, fps)
+
+
+def _ken_burns_source(image_path, duration, W, H, fps):
+    """
+    Pick the Ken Burns effect for an image and render it with ffmpeg.
+
+    Returns:
+        (path to the cached MP4 or None, effect name)
+    """
+    try:
+        image_hash = hash_file(image_path)
+    except OSError:
+        return None, random.choice(KEN_BURNS_EFFECTS)
+
+    effect = random.Random(image_hash).choice(KEN_BURNS_EFFECTS)
+    return _render_ken_burns(image_path, image_hash, effect, duration, W, H, fps), effect
+
+
+def _render_ken_burns(image_path, image_hash, effect, duration, W, H, fps):
+    """
+    Render a Ken Burns move over an image with ffmpeg zoompan.
+
+    Args:
+        image_hash: Content hash of the image (cache key, see hash_file)
+
+    Returns:
+        Path to the cached MP4, or None if ffmpeg failed
+    """
+    key = f"{image_hash}|{effect}|{duration:.3f}|{W}x{H}|{fps}"
+    ensure_cache_dir("kenburns")
+    out_path = get_cache_path(key, "kenburns", extension=".mp4")
+    if is_cached(out_path):
+        return out_path
+
+    frames = max(1, round(duration * fps))
+    # smooth_step(t / duration) over output frame number `on`
+    lin = f"(on/{max(frames - 1, 1)})"
+    progress = f"({lin}*{lin}*(3-2*{lin}))"
+    z, x, y = (expr.format(p=progress) for expr in _KEN_BURNS_ZOOMPAN[effect])
+
+    # Cover-fit at 2x first: zoompan positions on whole input pixels, so the
+    # supersampling keeps slow pans from stepping visibly
+    vf = (
+        f"scale={W * 2}:{H * 2}:force_original_aspect_ratio=increase,"
+        f"crop={W * 2}:{H * 2},"
+        f"zoompan=z='{z}':x='{x}':y='{y}':d={frames}:s={W}x{H}:fps={fps}"
+    )
+    tmp_path = f"{out_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    cmd = [
+        _ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error",
+        "-i", image_path,
+        "-vf", vf,
+        "-frames:v", str(frames),
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+        "-pix_fmt", "yuv420p", "-an",
+        "-f", "mp4", tmp_path,
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        if result.returncode == 0 and is_cached(tmp_path):
+            os.replace(tmp_path, out_path)
+            return out_path
+        print(f"   [Timeline] ffmpeg Ken Burns failed: {result.stderr[-200:]}")
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"   [Timeline] ffmpeg Ken Burns failed: {e}")
+
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    return None
+
+
+def _ken_burns_frames(clip, effect, duration, W, H, fps=30):
     """
-    Apply Ken Burns (pan/zoom) effect to a static image clip.
+    Ken Burns via a per-frame PIL crop/resize callback (fallback path).
 
-    Randomly chooses one of 5 effects: zoom_in, zoom_out, pan_left, pan_right, diagonal.
     The image is upscaled 20% to provide room for movement.
     """
     try:
@@ -74,64 +294,61 @@ def _apply_ken_burns(clip, duration, W, H):
         # Upscale by 20% for movement room
         up_w = int(W * 1.2)
         up_h = int(H * 1.2)
-        pil_img = pil_img.resize((up_w, up_h), Image.LANCZOS)
-
-        effects = ["zoom_in", "zoom_out", "pan_left", "pan_right", "diagonal"]
-        effect = random.choice(effects)
+        pil_img = _lanczos_resize(pil_img, (up_w, up_h))
+        # With OpenCV, frames are cut from this array directly (see below)
+        up = np.asarray(pil_img) if cv2 is not None else None
+
+        # The crop box is a closed-form function of t: tabulate it for every
+        # output frame at once (NumPy) instead of evaluating easing and
+        # geometry per call
+        num_frames = max(1, math.ceil(duration * fps))
+        lin = np.arange(num_frames) / max(1, num_frames - 1)
+        progress = lin * lin * (3.0 - 2.0 * lin)  # smooth_step
+
+        if effect == "zoom_in":
+            # 1.0x -> 1.15x zoom into center
+            scale = 1.0 + 0.15 * progress
+        elif effect == "zoom_out":
+            # 1.15x -> 1.0x zoom out from center
+            scale = 1.15 - 0.15 * progress
+        elif effect in ("pan_left", "pan_right"):
+            # Slow pan with mild zoom
+            scale = np.full(num_frames, 1.05)
+        else:  # diagonal
+            # Zoom + diagonal pan
+            scale = 1.0 + 0.1 * progress
+
+        cw = (up_w / scale).astype(int)
+        ch = (up_h / scale).astype(int)
+        if effect in ("zoom_in", "zoom_out"):
+            x1 = (up_w - cw) // 2
+            y1 = (up_h - ch) // 2
+        elif effect == "pan_left":
+            x1 = ((up_w - cw) * (1.0 - progress)).astype(int)
+            y1 = (up_h - ch) // 2
+        elif effect == "pan_right":
+            x1 = ((up_w - cw) * progress).astype(int)
+            y1 = (up_h - ch) // 2
+        else:  # diagonal
+            x1 = ((up_w - cw) * progress * 0.6).astype(int)
+            y1 = ((up_h - ch) * progress * 0.6).astype(int)
+
+        # Plain int tuples so the per-frame lookup stays cheap
+        boxes = list(zip(x1.tolist(), y1.tolist(), cw.tolist(), ch.tolist()))
 
         def make_frame(t):
-            progress = smooth_step(t / max(0.01, duration))
-
-            if effect == "zoom_in":
-                # 1.0x -> 1.15x zoom into center
-                scale = 1.0 + 0.15 * progress
-                cw = int(up_w / scale)
-                ch = int(up_h / scale)
-                x1 = (up_w - cw) // 2
-                y1 = (up_h - ch) // 2
-
-            elif effect == "zoom_out":
-                # 1.15x -> 1.0x zoom out from center
-                scale = 1.15 - 0.15 * progress
-                cw = int(up_w / scale)
-                ch = int(up_h / scale)
-                x1 = (up_w - cw) // 2
-                y1 = (up_h - ch) // 2
-
-            elif effect == "pan_left":
-                # Slow pan left with mild zoom
-                scale = 1.05
-                cw = int(up_w / scale)
-                ch = int(up_h / scale)
-                max_shift = up_w - cw
-                x1 = int(max_shift * (1.0 - progress))
-                y1 = (up_h - ch) // 2
-
-            elif effect == "pan_right":
-                # Slow pan right with mild zoom
-                scale = 1.05
-                cw = int(up_w / scale)
-                ch = int(up_h / scale)
-                max_shift = up_w - cw
-                x1 = int(max_shift * progress)
-                y1 = (up_h - ch) // 2
-
-            else:  # diagonal
-                # Zoom + diagonal pan
-                scale = 1.0 + 0.1 * progress
-                cw = int(up_w / scale)
-                ch = int(up_h / scale)
-                max_shift_x = up_w - cw
-                max_shift_y = up_h - ch
-                x1 = int(max_shift_x * progress * 0.6)
-                y1 = int(max_shift_y * progress * 0.6)
+            x1, y1, cw, ch = boxes[min(int(t * fps), num_frames - 1)]
 
             # Crop and resize back to target
-            cropped = pil_img.crop((x1, y1, x1 + cw, y1 + ch))
-            resized = cropped.resize((W, H), Image.LANCZOS)
+            if up is not None:
+                # The slice is a view, so the resize output is the only
+                # per-frame allocation (no PIL objects, no array copies)
+                return cv2.resize(up[y1:y1 + ch, x1:x1 + cw], (W, H),
+                                  interpolation=cv2.INTER_LANCZOS4)
+            resized = _lanczos_resize(pil_img, (W, H), box=(x1, y1, cw, ch))
             return np.array(resized)
 
-        kb_clip = VideoClip(make_frame, duration=duration).with_fps(10)
+        kb_clip = VideoClip(make_frame, duration=duration).with_fps(fps)
         return kb_clip
 
     except Exception as e:
@@ -175,35 +392,20 @@ def build_video_from_storyboard(storyboard, output_path, config):
 
     print(f"   [Timeline] Building {W}x{H} video, {total_duration:.1f}s")
 
-    # Build background layer from scene visuals
-    scene_clips = _build_scene_clips(storyboard, total_duration, W, H)
-
-    # Build audio
-    vo_audio = None
-    if audio_path:
-        vo_audio = AudioFileClip(audio_path)
-
-    # Build subtitle clips
-    subtitle_clips = _build_subtitles(storyboard, W, H, config)
+    # Audio (file probes/decoder setup) and subtitles don't depend on the
+    # scene visuals, so they are built alongside them
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        audio_future = pool.submit(_build_audio, audio_path, total_duration, config)
+        subtitles_future = pool.submit(_build_subtitles, storyboard, W, H, config)
 
-    # Build text overlays
-    text_overlays = _build_text_overlays(storyboard, W, H, config)
-
-    # Background music
-    music_clips = _build_music(total_duration, config)
+        # Build background layer from scene visuals
+        scene_clips, track_path = _build_scene_clips(storyboard, total_duration, W, H, FPS)
 
-    # Mix audio
-    audio_tracks = []
-    if vo_audio:
-        audio_tracks.append(vo_audio)
-    audio_tracks.extend(music_clips)
+        # Build text overlays
+        text_overlays = _build_text_overlays(storyboard, total_duration, W, H, config)
 
-    if len(audio_tracks) > 1:
-        final_audio = CompositeAudioClip(audio_tracks)
-    elif audio_tracks:
-        final_audio = audio_tracks[0]
-    else:
-        final_audio = None
+        subtitle_clips = subtitles_future.result()
+        vo_audio, final_audio = audio_future.result()
 
     # Logo and CTA
     logo_clip = _build_logo(total_duration, W, H, config)
@@ -219,7 +421,8 @@ def build_video_from_storyboard(storyboard, output_path, config):
     if cta_clip:
         layers.append(cta_clip)
 
-    final_video = CompositeVideoClip(layers, size=(W, H))
+    # bg_color fills wherever no scene is playing (same dark tone as ColorClips)
+    final_video = CompositeVideoClip(layers, size=(W, H), bg_color=(10, 10, 15))
     final_video = final_video.with_duration(total_duration)
 
     if final_audio:
@@ -232,103 +435,230 @@ def build_video_from_storyboard(storyboard, output_path, config):
     ])
 
     # Export
-    result = export_video(final_video, output_path, config)
-
-    # Cleanup
     try:
-        if vo_audio:
-            vo_audio.close()
-        final_video.close()
-        # Close visual_clip objects
-        for scene in storyboard.scenes:
-            if scene.visual_clip is not None:
-                try:
-                    scene.visual_clip.close()
-                except Exception:
-                    pass
-    except Exception:
-        pass
+        result = export_video(final_video, output_path, config,
+                              threads=video_config.get("threads", 0))
+    finally:
+        # Cleanup
+        try:
+            if vo_audio:
+                vo_audio.close()
+            final_video.close()
+            # Close visual_clip objects
+            for scene in storyboard.scenes:
+                if scene.visual_clip is not None:
+                    try:
+                        scene.visual_clip.close()
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+
+        # The ffmpeg scene track is an intermediate of this export only;
+        # close its reader before deleting the file
+        if track_path:
+            try:
+                scene_clips[0].close()
+            except Exception:
+                pass
+            try:
+                os.remove(track_path)
+            except OSError:
+                pass
 
     return result
 
 
-def _build_scene_clips(storyboard, total_duration, W, H):
-    """Build visual clips from storyboard scenes."""
-    clips = []
-    elapsed = 0.0
+def _prepare_scene(scene, dur, W, H, fps=30):
+    """
+    Build one scene's visual clip, sized to W x H and lasting dur seconds.
 
-    # Calculate per-scene duration from audio
-    num_scenes = len(storyboard.scenes)
-    if num_scenes == 0:
-        return [ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(total_duration)]
+    Runs on a worker thread; the caller sets start times and transitions.
+    """
+    if scene.visual_clip is not None:
+        # Animated clip from motion graphics or infographics
+        clip = scene.visual_clip
+        if clip.duration and clip.duration != dur:
+            if clip.duration > dur:
+                clip = clip.subclipped(0, dur)
+            else:
+                # Extend by holding last frame
+                clip = clip.with_duration(dur)
+        return clip
+
+    if not scene.visual_path:
+        # No visual, use dark background
+        return ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(dur)
+
+    try:
+        if scene.visual_path.lower().endswith(IMAGE_EXTENSIONS):
+            clip = _apply_ken_burns(scene.visual_path, dur, W, H, fps=fps)
+        elif scene.visual_path.lower().endswith(VIDEO_EXTENSIONS):
+            clip = _open_video(scene.visual_path, W, H)
+            clip = _resize_to_fill(clip, W, H)
+            if clip.duration > dur:
+                clip = clip.subclipped(0, dur)
+            elif clip.duration < dur:
+                # Loop short clips by wrapping time (t % duration) on the one
+                # reader, instead of concatenating copies of the clip
+                clip = clip.with_effects([vfx.Loop(duration=dur)])
+        else:
+            clip = ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(dur)
+    except Exception as e:
+        print(f"   [Timeline] Warning: Could not load {scene.visual_path}: {e}")
+        clip = ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(dur)
+    return clip
+
+
+def _scene_timing(storyboard, total_duration):
+    """
+    Start time of each scene and the shared per-scene duration.
+
+    Scenes split the time between the hook (first 3s) and the CTA (last 3s,
+    if any) evenly, at least 3s each. Used for both scene visuals and text
+    overlays so the two stay aligned.
 
-    # Distribute duration across scenes proportionally
-    scene_durations = []
+    Returns:
+        (starts, per_scene) — list of start times in seconds, duration
+    """
+    num_scenes = len(storyboard.scenes)
     hook_time = 3.0  # Reserve for hook
     cta_time = 3.0 if storyboard.cta else 0.0
     content_time = total_duration - hook_time - cta_time
-    per_scene = max(3.0, content_time / num_scenes)
+    per_scene = max(3.0, content_time / num_scenes) if num_scenes else 0.0
 
-    for scene in storyboard.scenes:
-        scene_durations.append(per_scene)
-
-    # Build clip for each scene
-    elapsed = hook_time  # Start after hook
-
-    for i, scene in enumerate(storyboard.scenes):
-        dur = scene_durations[i]
-
-        if scene.visual_clip is not None:
-            # Animated clip from motion graphics or infographics
-            clip = scene.visual_clip
-            if clip.duration and clip.duration != dur:
-                if clip.duration > dur:
-                    clip = clip.subclipped(0, dur)
-                else:
-                    # Extend by holding last frame
-                    clip = clip.with_duration(dur)
-        elif scene.visual_path:
-            try:
-                if scene.visual_path.lower().endswith((".png", ".jpg", ".jpeg")):
-                    clip = ImageClip(scene.visual_path).with_duration(dur)
-                    clip = _resize_to_fill(clip, W, H)
-                    clip = _apply_ken_burns(clip, dur, W, H)
-                elif scene.visual_path.lower().endswith((".mp4", ".avi", ".mov", ".webm")):
-                    clip = VideoFileClip(scene.visual_path, audio=False)
-                    clip = _resize_to_fill(clip, W, H)
-                    if clip.duration > dur:
-                        clip = clip.subclipped(0, dur)
-                    elif clip.duration < dur:
-                        # Loop short clips
-                        loops = int(dur / clip.duration) + 1
-                        clip = concatenate_videoclips([clip] * loops).subclipped(0, dur)
-                else:
-                    clip = ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(dur)
-            except Exception as e:
-                print(f"   [Timeline] Warning: Could not load {scene.visual_path}: {e}")
-                clip = ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(dur)
-        else:
-            # No visual, use dark background
-            clip = ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(dur)
+    # Multiplied rather than accumulated, so late scenes don't drift
+    starts = [hook_time + i * per_scene for i in range(num_scenes)]
+    return starts, per_scene
+
+
+def _scene_source(scene, dur, W, H, fps):
+    """Video file the ffmpeg scene track can use for a scene, or None."""
+    if scene.visual_clip is not None or not scene.visual_path:
+        return None
+
+    path = scene.visual_path.lower()
+    if path.endswith(VIDEO_EXTENSIONS):
+        return scene.visual_path
+    if path.endswith(IMAGE_EXTENSIONS):
+        return _ken_burns_source(scene.visual_path, dur, W, H, fps)[0]
+    return None
+
+
+def _build_scene_track(storyboard, starts, per_scene, total_duration, W, H, fps):
+    """
+    Render every scene into one clip with ffmpeg (see composer.ffmpeg_compose).
+
+    Only possible when each scene is file-backed and fades/cuts in.
+
+    Returns:
+        (VideoFileClip of the whole scene track, path of its temporary MP4),
+        or (None, None) to use the MoviePy path
+    """
+    scenes = storyboard.scenes
+    if any(s.visual_clip is not None or s.transition_in not in FADE_TRANSITIONS
+           for s in scenes):
+        return None, None
+
+    # Ken Burns renders run in parallel, as in the MoviePy path
+    with ThreadPoolExecutor(max_workers=min(SCENE_WORKERS, len(scenes))) as pool:
+        sources = list(pool.map(
+            lambda scene: _scene_source(scene, per_scene, W, H, fps), scenes,
+        ))
+    if not all(sources):
+        return None, None
+
+    segments = [
+        (source, start, per_scene,
+         0.0 if scene.transition_in == TransitionType.CUT else max(0.0, scene.transition_duration))
+        for scene, source, start in zip(scenes, sources, starts)
+    ]
+    track_path = compose_scene_track(segments, W, H, fps, total_duration)
+    if track_path is None:
+        return None, None
+
+    try:
+        track = VideoFileClip(track_path, audio=False).with_duration(total_duration)
+    except Exception as e:
+        print(f"   [Timeline] Could not load scene track: {e}")
+        os.remove(track_path)
+        return None, None
+    return track, track_path
+
+
+def _build_scene_clips(storyboard, total_duration, W, H, fps=30):
+    """
+    Build visual clips from storyboard scenes.
+
+    Returns:
+        (list of clips, path of a temporary scene track to delete after
+        export, or None)
+    """
+    clips = []
+
+    num_scenes = len(storyboard.scenes)
+    if num_scenes == 0:
+        return [ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(total_duration)], None
+
+    starts, per_scene = _scene_timing(storyboard, total_duration)
 
-        clip = clip.with_start(elapsed)
+    # Fast path: the whole scene track rendered by one ffmpeg filter graph
+    track, track_path = _build_scene_track(storyboard, starts, per_scene, total_duration, W, H, fps)
+    if track is not None:
+        return [track], track_path
+
+    # Decode/resize each scene's visual in parallel (PIL, OpenCV and the
+    # ffmpeg Ken Burns renders release the GIL); pool.map keeps scene order
+    with ThreadPoolExecutor(max_workers=min(SCENE_WORKERS, num_scenes)) as pool:
+        prepared = list(pool.map(
+            lambda scene: _prepare_scene(scene, per_scene, W, H, fps),
+            storyboard.scenes,
+        ))
+
+    # Place clips on the timeline in order
+    transition = TransitionEngine()
+
+    for scene, clip, start in zip(storyboard.scenes, prepared, starts):
+        clip = clip.with_start(start)
 
         # Apply transition
-        transition = TransitionEngine()
         clip = transition.apply_transition(clip, scene.transition_in, scene.transition_duration)
 
         clips.append(clip)
-        elapsed += dur
 
-    # If no clips at all, create a solid background
-    if not clips:
-        clips = [ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(total_duration)]
+    # No full-length background layer: the hook/CTA gaps and slide/crossfade
+    # reveals show the composite's own bg_color (see build_video_from_storyboard)
+    return clips, None
+
+
+def _build_audio(audio_path, total_duration, config):
+    """
+    Load the voiceover and mix it with background music.
+
+    Returns:
+        (voiceover clip or None, mixed audio clip or None)
+    """
+    vo_audio = None
+    if audio_path:
+        vo_audio = AudioFileClip(audio_path)
+
+    # Background music
+    music_clips = _build_music(total_duration, config)
+
+    # Mix audio
+    audio_tracks = []
+    if vo_audio:
+        audio_tracks.append(vo_audio)
+    audio_tracks.extend(music_clips)
 
-    # Add a base background that covers the whole duration
-    bg = ColorClip(size=(W, H), color=(10, 10, 15)).with_duration(total_duration)
-    clips.insert(0, bg)
+    if len(audio_tracks) > 1:
+        final_audio = CompositeAudioClip(audio_tracks)
+    elif audio_tracks:
+        final_audio = audio_tracks[0]
+    else:
+        final_audio = None
 
-    return clips
+    return vo_audio, final_audio
 
 
 def _build_subtitles(storyboard, W, H, config):
@@ -349,62 +679,53 @@ def _build_subtitles(storyboard, W, H, config):
     return create_subtitles(all_timestamps, W, H, sub_config)
 
 
-def _build_text_overlays(storyboard, W, H, config):
+def _build_text_overlays(storyboard, total_duration, W, H, config):
     """Build text overlay clips for each scene."""
     text_config = config.get("visuals", {}).get("text", {})
     overlays = []
-    elapsed = 3.0  # After hook
 
-    num_scenes = len(storyboard.scenes)
-    if num_scenes == 0:
+    if not storyboard.scenes:
         return []
 
-    total = storyboard.total_audio_duration or storyboard.target_duration
-    hook_time = 3.0
-    cta_time = 3.0 if storyboard.cta else 0.0
-    content_time = total - hook_time - cta_time
-    per_scene = max(3.0, content_time / num_scenes)
+    starts, per_scene = _scene_timing(storyboard, total_duration)
 
-    for scene in storyboard.scenes:
+    for scene, start in zip(storyboard.scenes, starts):
         if scene.text_overlay:
             from modules.composer import create_text_overlay
             clip = create_text_overlay(
-                scene.text_overlay, per_scene, elapsed, W, H, text_config
+                scene.text_overlay, per_scene, start, W, H, text_config
             )
             if clip:
                 overlays.append(clip)
-        elapsed += per_scene
 
     return overlays
 
 
+# Shared across videos so MusicManager's mtime-checked listing is reused
+_music_manager = None
+
+
 def _build_music(total_duration, config):
     """Build background music track."""
-    import random
-
     music_config = config.get("music", {})
     if not music_config.get("enabled", True):
         return []
 
-    music_dir = os.path.join(BASE_DIR, "assets", "music")
-    if not os.path.exists(music_dir):
-        return []
+    global _music_manager
+    if _music_manager is None:
+        from audio.music import MusicManager
+        _music_manager = MusicManager()
 
-    music_files = [
-        os.path.join(music_dir, f) for f in os.listdir(music_dir)
-        if f.endswith((".mp3", ".wav", ".ogg"))
-    ]
-
-    if not music_files:
+    music_path = _music_manager.get_music_file()
+    if not music_path:
         return []
 
     try:
-        music_path = random.choice(music_files)
         music = AudioFileClip(music_path)
         if music.duration < total_duration:
-            loops = int(total_duration / music.duration) + 1
-            music = concatenate_audioclips([music] * loops)
-        music = music.subclipped(0, total_duration)
+            music = music.with_effects([afx.AudioLoop(duration=total_duration)])
+        else:
+            music = music.subclipped(0, total_duration)
 
         vol = music_config.get("volume", 0.15)
         music = music.with_volume_scaled(vol)
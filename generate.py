@@ -29,6 +29,7 @@ VOICE DISCOVERY (NEW):
 
 import argparse
 import hashlib
+import json
 import os
 import sys
 import time
@@ -39,37 +40,65 @@ import yaml
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
-from modules.script_generator import generate_script
-from modules.voiceover import generate_voiceover
-from modules.visuals import search_and_download, create_fallback_clip
-from modules.composer import compose_video
-from modules.subtitles import create_subtitles
+# Pipeline modules (MoviePy, PIL, ...) are imported inside the run_*_mode
+# functions, so --help and --list-voices start without loading them.
 
 
-def ensure_first_run_setup():
-    """Download fonts and create directories on first run."""
-    fonts_dir = os.path.join(PROJECT_ROOT, "assets", "fonts")
-    os.makedirs(fonts_dir, exist_ok=True)
+FONTS_DIR = os.path.join(PROJECT_ROOT, "assets", "fonts")
+FONTS = {
+    "Montserrat-Bold.ttf": "https://github.com/JulietaUla/Montserrat/raw/master/fonts/ttf/Montserrat-Bold.ttf",
+    "Montserrat-Black.ttf": "https://github.com/JulietaUla/Montserrat/raw/master/fonts/ttf/Montserrat-Black.ttf",
+}
+
+# Written once setup has completed with every font in place
+SETUP_SENTINEL = os.path.join(PROJECT_ROOT, "cache", ".setup_done")
+
+
+def _setup_complete():
+    """True if a previous run finished setup and the fonts are still there."""
+    return os.path.exists(SETUP_SENTINEL) and all(
+        os.path.exists(os.path.join(FONTS_DIR, name)) for name in FONTS
+    )
 
-    fonts = {
-        "Montserrat-Bold.ttf": "https://github.com/JulietaUla/Montserrat/raw/master/fonts/ttf/Montserrat-Bold.ttf",
-        "Montserrat-Black.ttf": "https://github.com/JulietaUla/Montserrat/raw/master/fonts/ttf/Montserrat-Black.ttf",
-    }
 
+def _download_fonts(missing):
+    """Download (filename, url) pairs into FONTS_DIR concurrently over one session."""
     import requests
+    from concurrent.futures import ThreadPoolExecutor
+    from requests.adapters import HTTPAdapter
+
+    def download(filename, url):
+        print(f"   Downloading font: {filename}...")
+        try:
+            resp = session.get(url, timeout=30)
+            resp.raise_for_status()
+            with open(os.path.join(FONTS_DIR, filename), "wb") as f:
+                f.write(resp.content)
+            print(f"   Downloaded: {filename}")
+        except Exception as e:
+            print(f"   Warning: Could not download {filename}: {e}")
+
+    # Shared session: both fonts come from the same host, so the TLS
+    # connection is reused instead of renegotiated per file
+    with requests.Session() as session:
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            list(pool.map(lambda item: download(*item), missing))
+
+
+def ensure_first_run_setup():
+    """Download fonts and create directories on first run."""
+    if _setup_complete():
+        return
+
+    os.makedirs(FONTS_DIR, exist_ok=True)
 
-    for filename, url in fonts.items():
-        filepath = os.path.join(fonts_dir, filename)
-        if not os.path.exists(filepath):
-            print(f"   Downloading font: {filename}...")
-            try:
-                resp = requests.get(url, timeout=30)
-                resp.raise_for_status()
-                with open(filepath, "wb") as f:
-                    f.write(resp.content)
-                print(f"   Downloaded: {filename}")
-            except Exception as e:
-                print(f"   Warning: Could not download {filename}: {e}")
+    missing = [
+        (filename, url) for filename, url in FONTS.items()
+        if not os.path.exists(os.path.join(FONTS_DIR, filename))
+    ]
+    if missing:
+        _download_fonts(missing)
 
     for d in [
         "output/drafts", "output/ready",
@@ -80,6 +109,11 @@ def ensure_first_run_setup():
     ]:
         os.makedirs(os.path.join(PROJECT_ROOT, d), exist_ok=True)
 
+    # Only skip next time if nothing is missing (a failed download retries)
+    if all(os.path.exists(os.path.join(FONTS_DIR, name)) for name in FONTS):
+        with open(SETUP_SENTINEL, "w", encoding="utf-8"):
+            pass
+
 
 def load_config():
     """Load configuration from config.yaml."""
@@ -110,6 +144,11 @@ def _get_voice_for_language(lang, config):
 
 def run_standard_mode(args, config):
     """Standard video generation (voiceover + visuals + subtitles). UNCHANGED."""
+    from modules.script_generator import generate_script
+    from modules.voiceover import generate_voiceover
+    from modules.visuals import search_and_download, create_fallback_clip
+    from modules.composer import compose_video
+
     # Step 1: Generate Script
     print(f"\n[1/5] Generating script...")
     script = generate_script(
@@ -228,6 +267,8 @@ def run_auto_mode(args, config):
     # Update config with CLI overrides
     if brain_mode:
         config.setdefault("brain", {})["mode"] = brain_mode
+    if getattr(args, "no_brain_cache", False):
+        config.setdefault("brain", {})["cache"] = False
     if voice_clone:
         config.setdefault("audio", {}).setdefault("voice_clone", {})["enabled"] = True
 
@@ -273,7 +314,8 @@ def _get_output_path(args, suffix=""):
     return os.path.join(PROJECT_ROOT, "output", "drafts", f"{safe_name}{suffix}.mp4")
 
 
-def main():
+def build_parser():
+    """Build the command-line parser for generate.py."""
     parser = argparse.ArgumentParser(
         description="ULTIMATE AI VIDEO CREATOR — Generate short-form videos"
     )
@@ -300,6 +342,9 @@ def main():
                         help="Disable subtitles")
     parser.add_argument("--output", default=None,
                         help="Custom output path")
+    parser.add_argument("--result-json", default=None, metavar="PATH",
+                        help="Also write the output path and stats as JSON to PATH "
+                             "(used by batch_generate.py)")
 
     # NEW: AI Director args
     parser.add_argument("--brain", default="template",
@@ -310,23 +355,29 @@ def main():
                         help="Visual mode for auto mode (default: stock)")
     parser.add_argument("--voice-clone", action="store_true",
                         help="Enable voice cloning (requires reference audio)")
+    parser.add_argument("--no-brain-cache", action="store_true",
+                        help="Always call the Claude API instead of reusing cached storyboards")
 
     # NEW: Voice discovery
     parser.add_argument("--list-voices", metavar="LANG",
                         help="List available TTS voices for a language code (e.g., de, fr, ja)")
 
-    args = parser.parse_args()
+    return parser
 
-    # Handle list-voices command (no video generation)
-    if args.list_voices:
-        ensure_first_run_setup()
-        run_list_voices(args.list_voices)
-        return
 
-    # Topic is required for video generation
-    if not args.topic:
-        parser.error("--topic is required for video generation")
+def run(args):
+    """
+    Generate one video from parsed command-line args.
+
+    Called by main() and directly by batch_generate.py worker processes,
+    which reuse already-imported modules across many videos.
+
+    Args:
+        args: Namespace from build_parser().parse_args()
 
+    Returns:
+        Path to the output video
+    """
     start_time = time.time()
 
     is_conversation = args.mode in ("chat", "podcast", "story")
@@ -381,8 +432,35 @@ def main():
         print(f"  Hashtags: {' '.join(hashtags)}")
     print(f"{'=' * 55}")
 
+    if args.result_json:
+        with open(args.result_json, "w", encoding="utf-8") as f:
+            json.dump({
+                "output": output_path,
+                "duration": duration,
+                "size_mb": round(file_size, 1),
+                "time": round(elapsed, 1),
+                "hashtags": hashtags,
+            }, f)
+
     return output_path
 
 
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # Handle list-voices command (no video generation)
+    if args.list_voices:
+        ensure_first_run_setup()
+        run_list_voices(args.list_voices)
+        return
+
+    # Topic is required for video generation
+    if not args.topic:
+        parser.error("--topic is required for video generation")
+
+    return run(args)
+
+
 if __name__ == "__main__":
     main()
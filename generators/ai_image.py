@@ -7,13 +7,22 @@ Fallback:   Pollinations.ai (free, no API key needed)
 All GPU features are optional — works without GPU or API keys.
 """
 
-import hashlib
+import functools
+import json
 import os
 
-from utils.cache import ensure_cache_dir, is_cached
+from utils.cache import cache_key, ensure_cache_dir, is_cached
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# local.upscale_filter -> PIL resampling filter name (module-level constants,
+# which Pillow-SIMD has too, unlike Image.Resampling). Bicubic is noticeably
+# faster than Lanczos with near-identical results for a 512px source.
+UPSCALE_FILTERS = {"lanczos": "LANCZOS", "bicubic": "BICUBIC", "bilinear": "BILINEAR"}
+
+# Cached PNGs are intermediates: fast zlib level, still lossless
+PNG_COMPRESS_LEVEL = 1
+
 
 class LocalImageGenerator:
     """
@@ -31,11 +40,21 @@ class LocalImageGenerator:
         self.height = self.config.get("height", 512)
         self.steps = self.config.get("steps", 1)
         self.guidance_scale = self.config.get("guidance_scale", 0.0)
+        self.upscale_filter = self.config.get("upscale_filter", "lanczos")
+        self.batch_size = max(1, self.config.get("batch_size", 4))
+        self.compile = self.config.get("compile", False)
+        self.quantize = self.config.get("quantize")
         self._pipe = None
         self._loaded = False
+        self._parked = False
 
     def _ensure_loaded(self):
-        """Lazy-load the SDXL Turbo model."""
+        """Lazy-load the SDXL Turbo model (or bring a parked one back to the GPU)."""
+        if self._parked:
+            print("   [AI Image] Moving SDXL Turbo back to GPU...")
+            self._pipe.remove_all_hooks()
+            self._pipe = self._pipe.to("cuda")
+            self._parked = False
         if self._loaded:
             return
 
@@ -50,6 +69,14 @@ class LocalImageGenerator:
                 variant="fp16",
             )
             self._pipe = self._pipe.to("cuda")
+            # Decode batches one image at a time / in tiles: lower VAE peak
+            # memory, no effect on small single images
+            self._pipe.enable_vae_slicing()
+            self._pipe.enable_vae_tiling()
+            if self.quantize:
+                self._quantize_unet()
+            if self.compile:
+                self._compile(torch)
             self._loaded = True
             print("   [AI Image] SDXL Turbo loaded successfully")
 
@@ -61,6 +88,62 @@ class LocalImageGenerator:
         except Exception as e:
             raise RuntimeError(f"Failed to load SDXL Turbo: {e}")
 
+    def _quantize_unet(self):
+        """
+        Quantize the UNet weights to 8 bits with optimum-quanto.
+
+        quantize: "fp8" (needs torch>=2.3 and an Ampere+ GPU, compute
+        capability >= 8.0) or "int8". Halves UNet weight memory and
+        bandwidth; the VAE stays FP16 (it produces black images at lower
+        precision without a fixed VAE).
+        """
+        try:
+            from optimum.quanto import freeze, qfloat8, qint8, quantize
+        except ImportError:
+            print("   [AI Image] quantize needs: pip install optimum-quanto — skipping")
+            return
+
+        weights = {"fp8": qfloat8, "int8": qint8}.get(self.quantize)
+        if weights is None:
+            print(f"   [AI Image] Unknown quantize mode '{self.quantize}', skipping")
+            return
+
+        print(f"   [AI Image] Quantizing UNet weights to {self.quantize}...")
+        quantize(self._pipe.unet, weights=weights)
+        freeze(self._pipe.unet)
+
+    def _compile(self, torch):
+        """
+        torch.compile the UNet and VAE decoder (reduce-overhead = CUDA graphs).
+
+        Compiled graphs are specialized on tensor shapes, so every new
+        (batch size, width, height) combination recompiles; keep the
+        configured size fixed. A warm-up image is rendered here so the first
+        real prompt doesn't pay the compile time. Falls back to the eager
+        modules if compilation fails.
+        """
+        if not hasattr(torch, "compile"):
+            print("   [AI Image] torch.compile needs PyTorch 2.0+, skipping")
+            return
+
+        unet, vae_decode = self._pipe.unet, self._pipe.vae.decode
+        try:
+            print("   [AI Image] Compiling SDXL Turbo (takes a while on first run)...")
+            self._pipe.unet = torch.compile(unet, mode="reduce-overhead", fullgraph=True)
+            self._pipe.vae.decode = torch.compile(vae_decode, mode="reduce-overhead", fullgraph=True)
+            self._pipe.set_progress_bar_config(disable=True)
+            with torch.inference_mode():
+                self._pipe(
+                    prompt="warmup",
+                    num_inference_steps=self.steps,
+                    guidance_scale=self.guidance_scale,
+                    width=self.width,
+                    height=self.height,
+                )
+        except Exception as e:
+            print(f"   [AI Image] torch.compile failed, running eager: {e}")
+            self._pipe.unet, self._pipe.vae.decode = unet, vae_decode
+
     def generate(self, prompt, width=None, height=None):
         """
         Generate an image from text prompt.
@@ -73,30 +156,71 @@ class LocalImageGenerator:
         Returns:
             Path to generated image
         """
-        w = width or self.width
-        h = height or self.height
+        return self._generate_many([prompt], width, height)[0][0]
 
-        cache_dir = ensure_cache_dir("ai_images")
-        cache_key = hashlib.md5(f"{prompt}_{w}_{h}_local".encode()).hexdigest()[:12]
-        output_path = os.path.join(cache_dir, f"sdxl_{cache_key}.png")
+    def generate_many(self, prompts, width=None, height=None):
+        """
+        Generate images for several prompts, batching pipeline calls.
+
+        Cached prompts are skipped and duplicates rendered once; the rest
+        go through the pipeline batch_size prompts at a time, which keeps
+        the GPU busier than one prompt per call.
+
+        Args:
+            prompts: List of text descriptions
+            width: Image width (default from config)
+            height: Image height (default from config)
 
-        if is_cached(output_path):
-            return output_path
+        Returns:
+            List of image paths, in prompt order
+        """
+        return [path for path, _ in self._generate_many(prompts, width, height)]
 
-        self._ensure_loaded()
+    def _generate_many(self, prompts, width=None, height=None):
+        """
+        Generate (or find cached) images; see generate_many().
 
-        print(f"   [AI Image] Generating: {prompt[:60]}...")
-        image = self._pipe(
-            prompt=prompt,
-            num_inference_steps=self.steps,
-            guidance_scale=self.guidance_scale,
-            width=w,
-            height=h,
-        ).images[0]
+        Returns:
+            List of (path, PIL image) — the image is None on a cache hit
+        """
+        w = width or self.width
+        h = height or self.height
 
-        image.save(output_path)
-        print(f"   [AI Image] Saved: {output_path}")
-        return output_path
+        cache_dir = ensure_cache_dir("ai_images")
+        paths = [
+            os.path.join(cache_dir, f"sdxl_{cache_key(prompt, w, h, 'local')}.png")
+            for prompt in prompts
+        ]
+
+        # path -> prompt for everything not cached yet (deduplicated)
+        pending = {
+            path: prompt for path, prompt in zip(paths, prompts)
+            if not is_cached(path)
+        }
+        images = {}
+
+        if pending:
+            self._ensure_loaded()
+            items = list(pending.items())
+            for i in range(0, len(items), self.batch_size):
+                batch = items[i:i + self.batch_size]
+                for _, prompt in batch:
+                    print(f"   [AI Image] Generating: {prompt[:60]}...")
+
+                batch_images = self._pipe(
+                    prompt=[prompt for _, prompt in batch],
+                    num_inference_steps=self.steps,
+                    guidance_scale=self.guidance_scale,
+                    width=w,
+                    height=h,
+                ).images
+
+                for (path, _), image in zip(batch, batch_images):
+                    image.save(path, compress_level=PNG_COMPRESS_LEVEL)
+                    images[path] = image
+                    print(f"   [AI Image] Saved: {path}")
+
+        return [(path, images.get(path)) for path in paths]
 
     def generate_and_upscale(self, prompt, target_w=1080, target_h=1920):
         """
@@ -113,33 +237,61 @@ class LocalImageGenerator:
         from PIL import Image
 
         cache_dir = ensure_cache_dir("ai_images")
-        cache_key = hashlib.md5(
-            f"{prompt}_{target_w}_{target_h}_upscaled".encode()
-        ).hexdigest()[:12]
-        upscaled_path = os.path.join(cache_dir, f"sdxl_up_{cache_key}.png")
+        key = cache_key(prompt, target_w, target_h, "upscaled", self.upscale_filter)
+        upscaled_path = os.path.join(cache_dir, f"sdxl_up_{key}.png")
 
         if is_cached(upscaled_path):
             return upscaled_path
 
-        # Generate at native resolution
-        raw_path = self.generate(prompt)
+        # Generate at native resolution (a fresh image is used as-is,
+        # not re-decoded from the PNG just written)
+        raw_path, img = self._generate_many([prompt])[0]
         if not raw_path:
             return None
+        if img is None:
+            img = Image.open(raw_path)
 
-        # Upscale with Pillow (Lanczos)
-        img = Image.open(raw_path)
-        img_upscaled = img.resize((target_w, target_h), Image.LANCZOS)
-        img_upscaled.save(upscaled_path)
+        # Upscale with Pillow (Pillow-SIMD vectorizes this when installed)
+        resample = UPSCALE_FILTERS.get(self.upscale_filter, "LANCZOS")
+        img_upscaled = img.resize((target_w, target_h), getattr(Image, resample))
+        img_upscaled.save(upscaled_path, compress_level=PNG_COMPRESS_LEVEL)
 
         print(f"   [AI Image] Upscaled to {target_w}x{target_h}")
         return upscaled_path
 
+    def park(self):
+        """
+        Free most VRAM but keep the weights in system RAM.
+
+        Uses diffusers model CPU offload, so the next generate() moves the
+        pipeline back to the GPU instead of reloading it from disk. A
+        compiled pipeline (CUDA graphs pin weight addresses) is unloaded.
+        """
+        if not self._loaded or self._parked:
+            return
+        if self.compile:
+            self.unload()
+            return
+
+        self._pipe.enable_model_cpu_offload()
+        self._parked = True
+
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+        print("   [AI Image] SDXL Turbo parked in system RAM, VRAM freed")
+
     def unload(self):
         """Free GPU memory by unloading the model."""
         if self._pipe is not None:
             del self._pipe
             self._pipe = None
             self._loaded = False
+            self._parked = False
 
             try:
                 import torch
@@ -175,6 +327,10 @@ class PollinationsImageGenerator:
         from modules.image_gen import generate_image_pollinations
         return generate_image_pollinations(prompt, width, height)
 
+    def park(self):
+        """No-op for API-based generator."""
+        pass
+
     def unload(self):
         """No-op for API-based generator."""
         pass
@@ -184,13 +340,22 @@ def get_image_generator(config=None):
     """
     Factory function — returns appropriate image generator.
 
+    Generators are cached per config, so a loaded SDXL Turbo pipeline stays
+    resident across videos in the same process (e.g. batch workers).
+
     Args:
         config: generators.ai_image config dict
 
     Returns:
         Image generator instance (Local or Pollinations)
     """
-    config = config or {}
+    return _cached_image_generator(json.dumps(config or {}, sort_keys=True, default=str))
+
+
+@functools.lru_cache(maxsize=2)
+def _cached_image_generator(config_json):
+    """Build an image generator for a JSON-serialized config (cached)."""
+    config = json.loads(config_json)
     engine = config.get("engine", "pollinations")
 
     if engine == "local":
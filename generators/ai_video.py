@@ -11,20 +11,84 @@ Timeout: 10 minutes per clip
 All AI features are optional — the system works without GPU.
 """
 
-import hashlib
+import functools
 import json
+import multiprocessing.util
 import os
 import shutil
 import subprocess
 import sys
-import tempfile
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
-from utils.cache import ensure_cache_dir, is_cached
+from utils.cache import cache_key, ensure_cache_dir, is_cached
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# pid -> scratch dir; keyed by pid so forked batch workers get their own
+_scratch_dirs = {}
+_scratch_lock = threading.Lock()
+
+
+def _scratch_dir():
+    """
+    This process's scratch dir for Wan2GP job files (cache/ai_video/tmp/<pid>).
+
+    Per process, so parallel runs never hand each other's wgp.py the wrong
+    queue.zip; removed when the process exits.
+    """
+    pid = os.getpid()
+    with _scratch_lock:
+        path = _scratch_dirs.get(pid)
+        if path is None:
+            path = ensure_cache_dir(os.path.join("ai_video", "tmp", str(pid)))
+            # A multiprocessing finalizer, unlike atexit, also runs when a
+            # forked pool worker exits (those skip atexit via os._exit)
+            multiprocessing.util.Finalize(
+                None, shutil.rmtree, args=(path,), kwargs={"ignore_errors": True},
+                exitpriority=0,
+            )
+            _scratch_dirs[pid] = path
+    return path
+
+
+def _scan_mp4(directory):
+    """DirEntry objects for the .mp4 files in directory (empty if missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.name.endswith(".mp4")]
+    except OSError:
+        return []
+
+
+def _list_mp4(directory):
+    """Names of the .mp4 files in directory."""
+    return {entry.name for entry in _scan_mp4(directory)}
+
+
+def _log_tail(path, size=200):
+    """Last size bytes of a log file, decoded for printing."""
+    with open(path, "rb") as f:
+        f.seek(max(0, os.fstat(f.fileno()).st_size - size))
+        return f.read().decode("utf-8", errors="replace")
+
+
+def _link_or_copy(src, dst):
+    """
+    Hard-link src to dst, copying only if linking fails.
+
+    A link is a metadata-only operation when Wan2GP's output/ and the cache
+    share a filesystem, and it leaves the original in Wan2GP's gallery.
+    Falls back to a full copy across devices or on filesystems without
+    hard links.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class Wan2GPVideoGenerator:
     """
@@ -69,16 +133,25 @@ class Wan2GPVideoGenerator:
             print("   [AI Video] Wan2GP not configured or not found")
             return None
 
-        # Check cache
-        cache_key = hashlib.md5(
-            f"{prompt}_{duration}_{self.model}".encode()
-        ).hexdigest()[:12]
-        output_path = os.path.join(self.cache_dir, f"wan2gp_{cache_key}.mp4")
-
+        output_path = self._cache_path(prompt, duration)
         if is_cached(output_path):
             print(f"   [AI Video] Cache hit: {output_path}")
             return output_path
 
+        return self._generate(prompt, output_path)
+
+    def _cache_path(self, prompt, duration):
+        """Cache file for a (prompt, duration) pair with the current model."""
+        key = cache_key(prompt, duration, self.model)
+        return os.path.join(self.cache_dir, f"wan2gp_{key}.mp4")
+
+    def _cache_probe(self, item):
+        """(cache path, cached?) for a (prompt, duration) batch item."""
+        path = self._cache_path(*item)
+        return path, is_cached(path)
+
+    def _generate(self, prompt, output_path):
+        """Run Wan2GP for a cache miss; returns output_path or None."""
         print(f"   [AI Video] Generating: {prompt[:60]}...")
         print(f"   [AI Video] Model: {self.model}, Resolution: {self.resolution}")
         print(f"   [AI Video] CPU offload: {self.cpu_offload}")
@@ -106,73 +179,84 @@ class Wan2GPVideoGenerator:
         """
         wgp_script = os.path.join(self.wan2gp_path, "wgp.py")
 
-        # Create temporary job directory
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create job config
-            job_config = {
-                "prompt": prompt,
-                "negative_prompt": "blurry, distorted, low quality, watermark",
-                "width": self.resolution[0],
-                "height": self.resolution[1],
-                "num_frames": 81,  # ~5 seconds at 16fps
-                "guidance_scale": 5.0,
-                "num_inference_steps": 20,
-                "seed": -1,
-            }
-
-            # Write job JSON
-            job_path = os.path.join(tmpdir, "job.json")
-            with open(job_path, "w") as f:
-                json.dump(job_config, f)
-
-            # Create queue.zip
-            queue_zip = os.path.join(tmpdir, "queue.zip")
-            with zipfile.ZipFile(queue_zip, "w") as zf:
-                zf.write(job_path, "job.json")
-
-            # Build command
-            cmd = [
-                sys.executable, wgp_script,
-                "--process", queue_zip,
-            ]
-
-            if self.cpu_offload:
-                cmd.append("--cpu-offload")
-
-            # Run subprocess
-            print(f"   [AI Video] Running Wan2GP subprocess...")
-            start_time = time.time()
-
-            result = subprocess.run(
+        # Create job config
+        job_config = {
+            "prompt": prompt,
+            "negative_prompt": "blurry, distorted, low quality, watermark",
+            "width": self.resolution[0],
+            "height": self.resolution[1],
+            "num_frames": 81,  # ~5 seconds at 16fps
+            "guidance_scale": 5.0,
+            "num_inference_steps": 20,
+            "seed": -1,
+        }
+
+        # Create queue.zip with job.json written straight into it
+        # (stored: the JSON is tiny, so deflate would only cost time).
+        # The scratch dir is reused across this process's runs; the
+        # replace keeps the write atomic.
+        scratch = _scratch_dir()
+        queue_zip = os.path.join(scratch, "queue.zip")
+        tmp_zip = f"{queue_zip}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with zipfile.ZipFile(tmp_zip, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("job.json", json.dumps(job_config))
+        os.replace(tmp_zip, queue_zip)
+
+        # Build command
+        cmd = [
+            sys.executable, wgp_script,
+            "--process", queue_zip,
+        ]
+
+        if self.cpu_offload:
+            cmd.append("--cpu-offload")
+
+        # Snapshot existing outputs so the new clip is found by name
+        # (no stat of every past generation afterwards)
+        output_dir = os.path.join(self.wan2gp_path, "output")
+        before = _list_mp4(output_dir)
+
+        # Run subprocess
+        print(f"   [AI Video] Running Wan2GP subprocess...")
+        start_time = time.time()
+
+        # Output goes to a log file rather than a pipe, so a verbose run
+        # doesn't accumulate in this process's memory
+        log_path = os.path.join(scratch, "wan2gp.log")
+        with open(log_path, "wb") as log_file:
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
                 cwd=self.wan2gp_path,
-                timeout=self.timeout,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
             )
-
-            elapsed = time.time() - start_time
-            print(f"   [AI Video] Subprocess completed in {elapsed:.1f}s")
-
-            if result.returncode != 0:
-                print(f"   [AI Video] Subprocess error: {result.stderr[-200:]}")
-                return False
-
-            # Find output video in Wan2GP output directory
-            output_dir = os.path.join(self.wan2gp_path, "output")
-            if os.path.exists(output_dir):
-                videos = sorted(
-                    [f for f in os.listdir(output_dir) if f.endswith(".mp4")],
-                    key=lambda f: os.path.getmtime(os.path.join(output_dir, f)),
-                    reverse=True,
-                )
-                if videos:
-                    src = os.path.join(output_dir, videos[0])
-                    shutil.copy2(src, output_path)
-                    return True
-
+            try:
+                proc.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+
+        elapsed = time.time() - start_time
+        print(f"   [AI Video] Subprocess completed in {elapsed:.1f}s")
+
+        if proc.returncode != 0:
+            print(f"   [AI Video] Subprocess error: {_log_tail(log_path)}")
             return False
 
+        # Find the video this run added to the Wan2GP output directory
+        new_videos = [
+            entry for entry in _scan_mp4(output_dir)
+            if entry.name not in before
+        ]
+        if new_videos:
+            src = max(new_videos, key=lambda entry: entry.stat().st_mtime).path
+            _link_or_copy(src, output_path)
+            return True
+
+        print("   [AI Video] Wan2GP finished but wrote no new video")
+        return False
+
     def generate_batch(self, prompts):
         """
         Generate multiple video clips (serialized — one at a time due to VRAM).
@@ -183,14 +267,49 @@ class Wan2GPVideoGenerator:
         Returns:
             List of output paths (None for failed generations)
         """
+        if not self.is_available():
+            print("   [AI Video] Wan2GP not configured or not found")
+            return [None] * len(prompts)
+
+        # Resolve every cache path and hit up front, overlapping the stat
+        # calls in a pool; the loop below only runs Wan2GP for the misses
+        with ThreadPoolExecutor(max_workers=min(8, len(prompts) or 1)) as pool:
+            statuses = list(pool.map(self._cache_probe, prompts))
+
         results = []
-        for i, (prompt, duration) in enumerate(prompts):
+        generated = {}  # path -> result, so repeated prompts run once
+        # Generation stays serial: only one Wan2GP model fits in VRAM
+        for i, ((prompt, _), (path, hit)) in enumerate(zip(prompts, statuses)):
             print(f"\n   [AI Video] Batch {i+1}/{len(prompts)}")
-            path = self.generate_single(prompt, duration)
-            results.append(path)
+            if hit:
+                print(f"   [AI Video] Cache hit: {path}")
+                results.append(path)
+                continue
+            if path not in generated:
+                generated[path] = self._generate(prompt, path)
+            results.append(generated[path])
         return results
 
 
+def get_video_generator(config=None):
+    """
+    Factory function — returns a Wan2GP generator, cached per config.
+
+    Args:
+        config: generators.ai_video config dict
+
+    Returns:
+        Wan2GPVideoGenerator instance
+    """
+    return _cached_video_generator(json.dumps(config or {}, sort_keys=True, default=str))
+
+
+@functools.lru_cache(maxsize=2)
+def _cached_video_generator(config_json):
+    """Build a video generator for a JSON-serialized config (cached)."""
+    return Wan2GPVideoGenerator(json.loads(config_json))
+
+
 def is_ai_video_available(config=None):
     """Check if AI video generation is available."""
     config = config or {}
@@ -9,31 +9,60 @@ import hashlib
 import json
 import os
 import re
+import threading
 
 import requests
 from PIL import Image, ImageDraw, ImageFont
 
+# Optional: POSIX file locks serialize index updates across batch worker
+# processes (elsewhere only threads within one process are serialized)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_DIR = os.path.join(BASE_DIR, "cache", "footage")
 CACHE_INDEX = os.path.join(CACHE_DIR, "_index.json")
 
+# Guards read-modify-write of the cache index across threads
+_index_lock = threading.Lock()
+
 
 def _ensure_dirs():
     os.makedirs(CACHE_DIR, exist_ok=True)
 
 
 def _load_cache_index():
-    """Load the download cache index."""
-    if os.path.exists(CACHE_INDEX):
+    """Load the download cache index (a missing or corrupt index is empty)."""
+    try:
         with open(CACHE_INDEX, "r", encoding="utf-8") as f:
             return json.load(f)
-    return {}
+    except (OSError, ValueError):
+        return {}
 
 
 def _save_cache_index(index):
-    """Save the download cache index."""
-    with open(CACHE_INDEX, "w", encoding="utf-8") as f:
+    """Save the download cache index (atomically, so concurrent readers never see a partial file)."""
+    tmp_path = f"{CACHE_INDEX}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(index, f, indent=2)
+    os.replace(tmp_path, CACHE_INDEX)
+
+
+def _update_cache_index(key, entry):
+    """
+    Set one index entry, merging with whatever is on disk right now.
+
+    The index is re-read under the lock, so entries written meanwhile by
+    other threads, or other processes when fcntl is available, survive.
+    """
+    with _index_lock, open(f"{CACHE_INDEX}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        index = _load_cache_index()
+        index[key] = entry
+        _save_cache_index(index)
 
 
 def _query_hash(query):
@@ -128,16 +157,20 @@ def search_pexels(query, count=3, orientation="portrait", min_duration=5, max_du
 
 
 def download_video(url, output_path):
-    """Download a video file from URL."""
+    """Download a video file from URL (written atomically via a .part file)."""
+    part_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.part"
     try:
         resp = requests.get(url, stream=True, timeout=60)
         resp.raise_for_status()
-        with open(output_path, "wb") as f:
+        with open(part_path, "wb") as f:
             for chunk in resp.iter_content(chunk_size=8192):
                 f.write(chunk)
+        os.replace(part_path, output_path)
         return True
     except Exception as e:
         print(f"   [Visuals] Download error: {e}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
         return False
 
 
@@ -178,7 +211,6 @@ def search_and_download(query, output_dir=None, count=3, orientation="portrait",
         return [fallback] if fallback else []
 
     # Download each video
-    index = _load_cache_index()
     q_hash = _query_hash(query)
     downloaded = []
 
@@ -194,12 +226,11 @@ def search_and_download(query, output_dir=None, count=3, orientation="portrait",
         if download_video(video["url"], filepath):
             downloaded.append(filepath)
 
-    # Update cache index
-    index[q_hash] = {
+    # Update cache index (merged: scenes and batch jobs download concurrently)
+    _update_cache_index(q_hash, {
         "query": query,
         "files": downloaded,
-    }
-    _save_cache_index(index)
+    })
 
     return downloaded
 
@@ -16,12 +16,14 @@ import sys
 
 import edge_tts
 
+from utils.cache import ensure_dir
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_DIR = os.path.join(BASE_DIR, "cache", "tts")
 
 
 def _ensure_cache_dir():
-    os.makedirs(CACHE_DIR, exist_ok=True)
+    ensure_dir(CACHE_DIR)
 
 
 def _get_cache_path(text, voice, rate, pitch):
@@ -104,29 +106,31 @@ async def _generate_voiceover_async(
     communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
 
     sentence_boundaries = []
-    audio_chunks = []
-
-    async for chunk in communicate.stream():
-        if chunk["type"] == "audio":
-            audio_chunks.append(chunk["data"])
-        elif chunk["type"] == "SentenceBoundary":
-            sentence_boundaries.append({
-                "offset": chunk["offset"],
-                "duration": chunk["duration"],
-                "text": chunk["text"],
-            })
-        elif chunk["type"] == "WordBoundary":
-            # Edge TTS 6.x compatibility (if it ever returns these)
-            sentence_boundaries.append({
-                "offset": chunk["offset"],
-                "duration": chunk["duration"],
-                "text": chunk["text"],
-            })
 
-    # Write audio file
-    with open(output_path, "wb") as f:
-        for audio_data in audio_chunks:
-            f.write(audio_data)
+    # Stream audio straight to disk as it arrives
+    try:
+        with open(output_path, "wb") as f:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+                elif chunk["type"] == "SentenceBoundary":
+                    sentence_boundaries.append({
+                        "offset": chunk["offset"],
+                        "duration": chunk["duration"],
+                        "text": chunk["text"],
+                    })
+                elif chunk["type"] == "WordBoundary":
+                    # Edge TTS 6.x compatibility (if it ever returns these)
+                    sentence_boundaries.append({
+                        "offset": chunk["offset"],
+                        "duration": chunk["duration"],
+                        "text": chunk["text"],
+                    })
+    except BaseException:
+        # Don't leave a truncated MP3 behind
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
 
     # Interpolate word-level timestamps from sentence boundaries
     timestamps = _interpolate_word_timestamps(sentence_boundaries)
@@ -162,6 +166,27 @@ def _get_audio_duration(path):
         return round(size / 16000, 2)
 
 
+async def generate_voiceover_async(
+    text,
+    output_path=None,
+    voice="en-US-GuyNeural",
+    rate="+0%",
+    pitch="+0Hz",
+):
+    """
+    Async variant of generate_voiceover() for callers that run their own
+    event loop (e.g. to synthesize several clips concurrently).
+
+    Takes the same arguments and returns the same dict as generate_voiceover().
+    """
+    if output_path is None:
+        output_path = _get_cache_path(text, voice, rate, pitch)
+
+    ensure_dir(os.path.dirname(output_path))
+
+    return await _generate_voiceover_async(text, output_path, voice, rate, pitch)
+
+
 def generate_voiceover(
     text,
     output_path=None,
@@ -188,7 +213,7 @@ def generate_voiceover(
     if output_path is None:
         output_path = _get_cache_path(text, voice, rate, pitch)
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ensure_dir(os.path.dirname(output_path))
 
     # Run async function
     if sys.platform == "win32":
@@ -2,6 +2,8 @@
 Animation utilities — easing functions and interpolation for smooth animations.
 
 Used by motion graphics, infographics, Ken Burns effect, and transitions.
+These run once per frame in Python callbacks, so they clamp with plain
+comparisons and multiply instead of calling min/max and **.
 """
 
 import math
@@ -9,28 +11,43 @@ import math
 
 def ease_out_cubic(t):
     """Fast start, slow end. Great for elements entering the screen."""
-    t = max(0.0, min(1.0, t))
-    return 1.0 - (1.0 - t) ** 3
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    u = 1.0 - t
+    return 1.0 - u * u * u
 
 
 def ease_in_out_cubic(t):
     """Smooth acceleration and deceleration. Great for fade transitions."""
-    t = max(0.0, min(1.0, t))
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
     if t < 0.5:
         return 4.0 * t * t * t
     else:
-        return 1.0 - (-2.0 * t + 2.0) ** 3 / 2.0
+        u = 2.0 - 2.0 * t
+        return 1.0 - u * u * u / 2.0
 
 
 def ease_out_quad(t):
     """Gentle deceleration. Subtler than cubic."""
-    t = max(0.0, min(1.0, t))
-    return 1.0 - (1.0 - t) ** 2
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    u = 1.0 - t
+    return 1.0 - u * u
 
 
 def ease_out_bounce(t):
     """Bounce effect at the end. Great for pop-in elements."""
-    t = max(0.0, min(1.0, t))
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
     if t < 1.0 / 2.75:
         return 7.5625 * t * t
     elif t < 2.0 / 2.75:
@@ -46,7 +63,10 @@ def ease_out_bounce(t):
 
 def smooth_step(t):
     """Hermite interpolation — smooth start and end."""
-    t = max(0.0, min(1.0, t))
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
     return t * t * (3.0 - 2.0 * t)
 
 
@@ -65,6 +85,8 @@ def interpolate(start, end, t, easing=None):
     """
     if easing:
         t = easing(t)
-    else:
-        t = max(0.0, min(1.0, t))
+    elif t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
     return start + (end - start) * t
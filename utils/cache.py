@@ -11,6 +11,26 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_ROOT = os.path.join(BASE_DIR, "cache")
 
 
+# Directories already created this process (skips repeated makedirs syscalls)
+_dirs_created = set()
+
+
+def ensure_dir(path):
+    """
+    Create a directory (and parents) once per process.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        The path, unchanged
+    """
+    if path not in _dirs_created:
+        os.makedirs(path, exist_ok=True)
+        _dirs_created.add(path)
+    return path
+
+
 def ensure_cache_dir(subdir=None):
     """
     Ensure a cache directory exists.
@@ -26,8 +46,7 @@ def ensure_cache_dir(subdir=None):
         path = os.path.join(CACHE_ROOT, subdir)
     else:
         path = CACHE_ROOT
-    os.makedirs(path, exist_ok=True)
-    return path
+    return ensure_dir(path)
 
 
 def get_cache_path(key_string, subdir, extension=".mp3"):
@@ -86,3 +105,22 @@ def save_cache_index(subdir, index_data):
 def hash_string(s, length=12):
     """Generate MD5 hash of a string, truncated to length."""
     return hashlib.md5(s.encode("utf-8")).hexdigest()[:length]
+
+
+def hash_file(path, length=16):
+    """Short hex hash (BLAKE2b) of a file's contents, read in 1 MB chunks."""
+    digest = hashlib.blake2b(digest_size=length // 2)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(*parts, length=12):
+    """
+    Short hex cache key from several values (BLAKE2b).
+
+    Parts are joined with NUL, so ("a_b", "c") and ("a", "b_c") differ.
+    """
+    data = "\0".join(map(str, parts)).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=length // 2).hexdigest()